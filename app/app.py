@@ -8,8 +8,8 @@ np.seterr(invalid='ignore')
 
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
 import time
+import statistics
 import sys
 from pathlib import Path
 
@@ -24,7 +24,59 @@ from src.performance_analyzer import PerformanceAnalyzer
 # Set page config
 st.set_page_config(page_title="DNA Pattern Matcher", layout="wide", initial_sidebar_state="expanded")
 
-st.write("App is loading...")
+
+@st.cache_resource
+def _get_dfa(pattern: str):
+    """Build the DFA for a pattern once and reuse it across reruns"""
+    return DFAStateMachine(pattern)
+
+
+def _matches_frame(dna, positions, length):
+    """
+    Build the match table column-wise from an array of start positions
+    
+    length and score are broadcast scalars, not per-row Python objects
+    """
+    seq_upper = dna.upper()
+    return pd.DataFrame({
+        'position': positions,
+        'sequence': [seq_upper[pos:pos + length] for pos in positions.tolist()],
+        'length': length,
+        'score': 1.0,
+    })
+
+
+@st.cache_data(show_spinner=False)
+def _run_benchmark(sizes: tuple, pattern: str, samples: int = 5):
+    """
+    Time DFA matching for each sequence size; cached per (sizes, pattern)
+    
+    Each sample times `reps` back-to-back calls with perf_counter_ns so
+    microsecond-scale runs are measurable; the median sample is reported.
+    """
+    dfa = _get_dfa(pattern)
+    times = []
+    
+    for size in sizes:
+        # Generate DNA sequence
+        dna = "ACGT" * (size // 4)
+        reps = max(3, 10**6 // max(size, 1))
+        
+        # Warm-up: JIT compilation and caches stay out of the timing
+        dfa.match(dna)
+        
+        per_call_ns = []
+        for _ in range(samples):
+            start = time.perf_counter_ns()
+            for _ in range(reps):
+                dfa.match(dna)
+            per_call_ns.append((time.perf_counter_ns() - start) / reps)
+        
+        times.append(statistics.median(per_call_ns) / 1e6)  # Convert to milliseconds
+    
+    return times
+
+
 st.sidebar.title("🧬 Navigation")
 page = st.sidebar.radio(
     "Go to",
@@ -84,7 +136,7 @@ elif page == "Pattern Search":
 
     if st.button("🔎 Search Pattern", use_container_width=True):
         # Validate sequence and pattern
-        if not SequenceHandler.validate_sequence(dna):
+        if not dna:
             st.error("❌ Invalid DNA sequence. Use only ATCG and N")
         elif not SequenceHandler.validate_sequence(pattern):
             st.error("❌ Invalid pattern. Use only ATCG and N")
@@ -93,21 +145,23 @@ elif page == "Pattern Search":
         else:
             try:
                 # Use DFA engine from backend
-                dfa = DFAStateMachine(pattern)
-                results = dfa.match(dna)
+                dfa = _get_dfa(pattern)
+                # Validates the sequence and finds matches in one pass
+                match_positions, invalid_index = dfa.scan_fused(dna)
 
-                if results:
-                    df = pd.DataFrame(results)
-                    st.success(f"✓ Found {len(results)} match(es)")
+                if invalid_index != -1:
+                    st.error("❌ Invalid DNA sequence. Use only ATCG and N")
+                elif len(match_positions):
+                    df = _matches_frame(dna, match_positions, len(dfa.pattern))
+                    st.success(f"✓ Found {len(match_positions)} match(es)")
                     st.dataframe(df, use_container_width=True)
                     
                     # Visualize matches
                     st.subheader("Match Visualization")
                     seq_display = dna.upper()
-                    match_positions = [r['position'] for r in results]
                     pattern_len = len(pattern)
                     
-                    for i, pos in enumerate(match_positions):
+                    for i, pos in enumerate(match_positions.tolist()):
                         st.write(f"Match {i+1}: Position {pos}")
                         before = seq_display[:pos]
                         match = seq_display[pos:pos+pattern_len]
@@ -153,26 +207,42 @@ elif page == "Motif Analysis":
         else:
             motif_sequence = all_motifs[motif_name]['sequence']
             
-            if not SequenceHandler.validate_sequence(dna):
-                st.error("❌ Invalid DNA sequence. Use only ATCG and N")
-            else:
-                try:
-                    dfa = DFAStateMachine(motif_sequence)
-                    matches = dfa.match(dna)
+            try:
+                dfa = _get_dfa(motif_sequence)
+                match_positions, invalid_index = dfa.scan_fused(dna)
+                
+                if invalid_index != -1:
+                    st.error("❌ Invalid DNA sequence. Use only ATCG and N")
+                elif len(match_positions):
+                    df = _matches_frame(dna, match_positions, len(dfa.pattern))
+                    st.success(f"✓ Found {len(match_positions)} motif match(es)")
+                    st.dataframe(df, use_container_width=True)
                     
-                    if matches:
-                        df = pd.DataFrame(matches)
-                        st.success(f"✓ Found {len(matches)} motif match(es)")
-                        st.dataframe(df, use_container_width=True)
-                        
-                        # Show match context
-                        st.subheader("Match Details")
-                        for i, match in enumerate(matches):
-                            st.write(f"**Match {i+1}:** {match['sequence']} at position {match['position']}")
-                    else:
-                        st.info(f"ℹ️ No matches found for motif '{motif_name}' ({motif_sequence})")
-                except Exception as e:
-                    st.error(f"❌ Error: {str(e)}")
+                    # Show match context
+                    st.subheader("Match Details")
+                    for i, row in enumerate(df.itertuples()):
+                        st.write(f"**Match {i+1}:** {row.sequence} at position {row.position}")
+                else:
+                    st.info(f"ℹ️ No matches found for motif '{motif_name}' ({motif_sequence})")
+            except Exception as e:
+                st.error(f"❌ Error: {str(e)}")
+    
+    if st.button("🧬 Search All Motifs", use_container_width=True):
+        if not dna:
+            st.error("❌ Please enter a DNA sequence")
+        elif not SequenceHandler.validate_sequence(dna):
+            st.error("❌ Invalid DNA sequence. Use only ATCG and N")
+        else:
+            # One Aho-Corasick pass over the sequence for every motif
+            hits = MotifDatabase.find_all_motifs(dna)
+            df = pd.DataFrame({
+                'motif': list(hits),
+                'sequence': [MotifDatabase.get_motif(name) for name in hits],
+                'matches': [len(positions) for positions in hits.values()],
+                'positions': [positions.tolist() for positions in hits.values()],
+            })
+            st.success(f"✓ Found {int(df['matches'].sum())} motif match(es)")
+            st.dataframe(df, use_container_width=True)
 
 elif page == "Benchmarks":
     st.title("⚡ Performance Benchmarks")
@@ -195,22 +265,7 @@ elif page == "Benchmarks":
         else:
             with st.spinner("Running benchmarks..."):
                 sizes = sorted(test_sizes)
-                times = []
-                
-                progress_bar = st.progress(0)
-                
-                for idx, size in enumerate(sizes):
-                    # Generate DNA sequence
-                    dna = "ACGT" * (size // 4)
-                    
-                    # Run DFA matching
-                    dfa = DFAStateMachine(pattern_input)
-                    start = time.time()
-                    dfa.match(dna)
-                    elapsed = time.time() - start
-                    times.append(elapsed * 1000)  # Convert to milliseconds
-                    
-                    progress_bar.progress((idx + 1) / len(sizes))
+                times = _run_benchmark(tuple(sizes), pattern_input)
                 
                 # Display results
                 df = pd.DataFrame({
@@ -222,27 +277,17 @@ elif page == "Benchmarks":
                 st.success("✓ Benchmark complete")
                 st.dataframe(df, use_container_width=True)
                 
-                # Plot results
+                # Plot results (Vega-Lite, rendered in the browser)
+                chart_data = df.set_index("Sequence Length (bp)")
                 col1, col2 = st.columns(2)
                 
                 with col1:
                     st.subheader("Execution Time")
-                    fig, ax = plt.subplots(figsize=(10, 5))
-                    ax.plot(sizes, times, marker='o', linewidth=2, markersize=8)
-                    ax.set_xlabel("Sequence Length (bp)")
-                    ax.set_ylabel("Time (ms)")
-                    ax.grid(True, alpha=0.3)
-                    st.pyplot(fig)
+                    st.line_chart(chart_data[["Time (milliseconds)"]])
                 
                 with col2:
                     st.subheader("Throughput (bp/ms)")
-                    fig, ax = plt.subplots(figsize=(10, 5))
-                    throughput = [sizes[i] / times[i] if times[i] > 0 else 0 for i in range(len(sizes))]
-                    ax.plot(sizes, throughput, marker='s', linewidth=2, markersize=8, color='green')
-                    ax.set_xlabel("Sequence Length (bp)")
-                    ax.set_ylabel("Throughput (bp/ms)")
-                    ax.grid(True, alpha=0.3)
-                    st.pyplot(fig)
+                    st.line_chart(chart_data[["Throughput (bp/ms)"]], color="#2ca02c")
 
 elif page == "About":
     st.title("ℹ️ About This Project")
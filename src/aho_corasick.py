@@ -4,13 +4,61 @@ Aho-Corasick Algorithm for multi-pattern DNA matching
 Time: O(n + m + z) where n=text, m=patterns, z=matches
 """
 
-class TrieNode:
-    """Node in Aho-Corasick trie"""
+import logging
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .dfa_engine import SYMBOLS, SYMBOL_CODES, encode, unpack_codes
+from .jit import njit, NUMBA_AVAILABLE
+
+logger = logging.getLogger(__name__)
+
+# Transition columns: one per DNA symbol, plus one for invalid bytes
+WIDTH = len(SYMBOLS) + 1
+
+
+@njit('Tuple((int64[:], int64[:]))(int32[:], int64, int64[:], int64[:], int64[:], uint8[:])',
+      cache=True, nogil=True)
+def _scan(goto, width, out_offsets, out_ids, lengths, seq):
+    """
+    Run the Aho-Corasick DFA over encoded text
+    
+    goto is the flat (num_states × width) transition table with failure
+    links already folded in, so each character is a single table load.
+    Patterns reported by state s are out_ids[out_offsets[s]:out_offsets[s + 1]].
+    
+    Returns:
+        (positions, pattern_ids) arrays, in text order
+    """
+    capacity = len(seq) + 16
+    positions = np.empty(capacity, dtype=np.int64)
+    pattern_ids = np.empty(capacity, dtype=np.int64)
+    count = 0
+    state = 0
+    
+    for i in range(len(seq)):
+        state = goto[state * width + seq[i]]
+        
+        for k in range(out_offsets[state], out_offsets[state + 1]):
+            if count == capacity:
+                # More hits than characters: grow both outputs
+                capacity *= 2
+                grown = np.empty(capacity, dtype=np.int64)
+                grown[:count] = positions[:count]
+                positions = grown
+                grown = np.empty(capacity, dtype=np.int64)
+                grown[:count] = pattern_ids[:count]
+                pattern_ids = grown
+            
+            pattern_id = out_ids[k]
+            positions[count] = i - lengths[pattern_id] + 1
+            pattern_ids[count] = pattern_id
+            count += 1
     
-    def __init__(self):
-        self.children = {}
-        self.fail = None
-        self.patterns = []  # List of pattern indices that end here
+    return positions[:count], pattern_ids[:count]
 
 
 class AhoCorasick:
@@ -29,66 +77,218 @@ class AhoCorasick:
         """
         self.patterns = [p.upper() for p in patterns]
         self.alphabet = {'A', 'T', 'C', 'G', 'N'}
-        self.root = TrieNode()
         self._build_trie()
         self._build_failure_function()
-        print(f"✓ Aho-Corasick initialized with {len(patterns)} patterns")
+        self._build_tables()
+        logger.debug("Aho-Corasick initialized with %d patterns", len(patterns))
     
     def _build_trie(self):
-        """Build trie with all patterns"""
+        """
+        Build trie with all patterns
+        
+        Nodes are integer ids (0 = root): children[s] maps a character
+        to the child id, outputs[s] lists pattern indices ending at s
+        """
+        self.children = [{}]
+        self.outputs = [[]]
+        
         for i, pattern in enumerate(self.patterns):
-            node = self.root
+            node = 0
             for char in pattern:
-                if char not in node.children:
-                    node.children[char] = TrieNode()
-                node = node.children[char]
-            node.patterns.append(i)
+                child = self.children[node].get(char)
+                if child is None:
+                    child = len(self.children)
+                    self.children[node][char] = child
+                    self.children.append({})
+                    self.outputs.append([])
+                node = child
+            self.outputs[node].append(i)
     
     def _build_failure_function(self):
         """
         Build failure links (like KMP failure function for trie)
         
         For each node, failure link points to longest proper suffix
-        that is also a prefix in the trie
+        that is also a prefix in the trie. The BFS runs over integer
+        ids and also fills the goto table, since a node's failure state
+        is always shallower and so already complete:
+            goto[s, c] = child(s, c) or goto[fail[s], c]
         """
-        from collections import deque
-        
-        queue = deque()
-        
-        # Root's failure link points to itself
-        self.root.fail = self.root
-        
-        # Level 1 nodes fail to root
-        for child in self.root.children.values():
-            child.fail = self.root
-            queue.append(child)
+        children = self.children
+        num_states = len(children)
+        fail = [0] * num_states
+        goto = [0] * (num_states * WIDTH)
+        queue = deque([0])
         
-        # Level 2+ nodes
         while queue:
-            node = queue.popleft()
+            state = queue.popleft()
+            row = state * WIDTH
             
-            for char, child in node.children.items():
-                # Find failure link for child
-                fail = node.fail
-                
-                while fail != self.root and char not in fail.children:
-                    fail = fail.fail
-                
-                if char in fail.children:
-                    child.fail = fail.children[char]
-                else:
-                    child.fail = self.root
+            # Missing edges behave like the failure state's
+            if state > 0:
+                fallback = fail[state] * WIDTH
+                goto[row:row + WIDTH] = goto[fallback:fallback + WIDTH]
+            
+            for char, child in children[state].items():
+                if state > 0:
+                    # Find failure link for child
+                    f = fail[state]
+                    while f > 0 and char not in children[f]:
+                        f = fail[f]
+                    fail[child] = children[f].get(char, 0)
+                    
+                    # Inherit patterns from failure link
+                    self.outputs[child].extend(self.outputs[fail[child]])
                 
-                # Inherit patterns from failure link
-                child.patterns.extend(child.fail.patterns)
+                # Characters outside ACGTN can never be matched in the text
+                code = SYMBOL_CODES.get(char)
+                if code is not None:
+                    goto[row + code] = child
                 queue.append(child)
+        
+        self.num_states = num_states
+        self.fail = np.array(fail, dtype=np.int32)
+        self.goto = np.array(goto, dtype=np.int32)
+    
+    def _build_tables(self):
+        """
+        Pack outputs and pattern lengths into arrays for the scan kernel
+        
+        Output patterns are stored CSR-style: state s reports
+        output_ids[output_offsets[s]:output_offsets[s + 1]].
+        """
+        offsets = np.zeros(self.num_states + 1, dtype=np.int64)
+        out_ids = []
+        
+        for state, patterns in enumerate(self.outputs):
+            out_ids.extend(patterns)
+            offsets[state + 1] = len(out_ids)
+        
+        self.output_offsets = offsets
+        self.output_ids = np.array(out_ids, dtype=np.int64)
+        self.lengths = np.array([len(p) for p in self.patterns], dtype=np.int64)
+    
+    def _scan_python(self, codes):
+        """
+        Plain-Python equivalent of _scan, used when Numba is missing
+        
+        Lists and bytes index much faster than ndarrays in the interpreter
+        """
+        goto = self.goto.tolist()
+        offsets = self.output_offsets.tolist()
+        out_ids = self.output_ids.tolist()
+        lengths = self.lengths.tolist()
+        outputs = [
+            [(lengths[pid], pid) for pid in out_ids[offsets[s]:offsets[s + 1]]]
+            for s in range(self.num_states)
+        ]
+        
+        positions = []
+        pattern_ids = []
+        state = 0
+        
+        for i, code in enumerate(codes):
+            state = goto[state * WIDTH + code]
+            
+            if outputs[state]:
+                for length, pattern_id in outputs[state]:
+                    positions.append(i - length + 1)
+                    pattern_ids.append(pattern_id)
+        
+        return np.array(positions, dtype=np.int64), np.array(pattern_ids, dtype=np.int64)
+    
+    def match_arrays(self, text):
+        """
+        Find all occurrences of all patterns, as parallel arrays
+        
+        Same search as match(), without building a dict per match.
+        
+        Args:
+            text: DNA sequence string or ASCII bytes
+        
+        Returns:
+            (positions, pattern_ids): np.ndarray[int64] each, in text order;
+            self.patterns[pattern_ids[k]] starts at positions[k]
+        """
+        return self._scan_codes(encode(text))
+    
+    def match_arrays_parallel(self, text, workers=None):
+        """
+        Same as match_arrays(), scanning chunks of text in threads
+        
+        The text is split into `workers` chunks, each extended by the
+        longest pattern length - 1 so matches crossing a boundary are
+        still seen; a match is kept only by the chunk it starts in. The
+        hits are then put back in match_arrays() order (by end position,
+        longer patterns first).
+        
+        Args:
+            text: DNA sequence string or ASCII bytes
+            workers: number of threads (default: os.cpu_count())
+        
+        Returns:
+            (positions, pattern_ids), same as match_arrays()
+        
+        The kernel releases the GIL, so this only scales with Numba.
+        N is an ordinary symbol here, so every chunk is exact.
+        """
+        workers = workers or os.cpu_count() or 1
+        seq = encode(text)
+        overlap = int(self.lengths.max()) - 1 if len(self.lengths) else 0
+        
+        if not NUMBA_AVAILABLE or workers == 1 or len(seq) < 2 * workers * (overlap + 1):
+            return self._scan_codes(seq)
+        
+        chunk = -(-len(seq) // workers)
+        
+        def scan_chunk(start):
+            positions, pattern_ids = self._scan_codes(seq[start:start + chunk + overlap])
+            keep = positions < chunk
+            return positions[keep] + start, pattern_ids[keep]
+        
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(scan_chunk, range(0, len(seq), chunk)))
+        
+        positions = np.concatenate([p for p, _ in parts])
+        pattern_ids = np.concatenate([ids for _, ids in parts])
+        lengths = self.lengths[pattern_ids]
+        order = np.lexsort((pattern_ids, -lengths, positions + lengths))
+        return positions[order], pattern_ids[order]
+    
+    def match_packed(self, packed, length, bits=2):
+        """
+        Find all pattern occurrences in a 2- or 4-bit packed sequence
+        
+        Args:
+            packed: np.ndarray[uint8] from pack_codes() or
+                    SequenceHandler.pack2bit() / pack4bit()
+            length: number of bases in the packed sequence
+            bits: 2 or 4, as packed
+        
+        Returns:
+            (positions, pattern_ids), same as match_arrays()
+        
+        The packed bytes are unpacked straight to symbol codes, which
+        index the goto table directly; no ASCII text is rebuilt.
+        """
+        return self._scan_codes(unpack_codes(packed, length, bits))
+    
+    def _scan_codes(self, seq):
+        """Run the compiled (or plain Python) scan over encoded text"""
+        if NUMBA_AVAILABLE:
+            return _scan(
+                self.goto, WIDTH, self.output_offsets, self.output_ids,
+                self.lengths, seq
+            )
+        return self._scan_python(seq.tobytes())
     
     def match(self, text):
         """
         Find all occurrences of all patterns in text
         
         Args:
-            text: DNA sequence string
+            text: DNA sequence string, or ASCII bytes (case-insensitive,
+                  no uppercase copy is made)
         
         Returns:
             List of dicts:
@@ -101,30 +301,17 @@ class AhoCorasick:
         
         Time: O(n + z) where n=len(text), z=matches
         """
-        matches = []
-        text_upper = text.upper()
-        node = self.root
+        positions, pattern_ids = self.match_arrays(text)
         
-        for i, char in enumerate(text_upper):
-            # Follow failure links until we find a match or reach root
-            while node != self.root and char not in node.children:
-                node = node.fail
-            
-            # Transition
-            if char in node.children:
-                node = node.children[char]
-            else:
-                node = self.root
-            
-            # Check for pattern matches at this position
-            for pattern_id in node.patterns:
-                pattern = self.patterns[pattern_id]
-                matches.append({
-                    'position': i - len(pattern) + 1,
-                    'pattern': pattern,
-                    'length': len(pattern),
-                    'pattern_id': pattern_id,
-                    'score': 1.0
-                })
+        matches = []
+        for position, pattern_id in zip(positions.tolist(), pattern_ids.tolist()):
+            pattern = self.patterns[pattern_id]
+            matches.append({
+                'position': position,
+                'pattern': pattern,
+                'length': len(pattern),
+                'pattern_id': pattern_id,
+                'score': 1.0
+            })
         
         return matches
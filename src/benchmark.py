@@ -3,40 +3,51 @@
 Benchmarking framework for DFA and Aho-Corasick algorithms
 """
 
+import logging
 import time
-import random
+
+import numpy as np
+
 from .dfa_engine import DFAStateMachine
 from .aho_corasick import AhoCorasick
 
+logger = logging.getLogger(__name__)
+
+
+# Base letters, indexed by 2-bit code (A=0, C=1, G=2, T=3)
+_BASES = np.frombuffer(b'ACGT', dtype=np.uint8)
+
 
 class BenchmarkRunner:
     """Benchmark DNA pattern matching algorithms"""
     
     @staticmethod
-    def generate_random_dna(length, gc_percentage=50):
+    def generate_random_dna(length, gc_percentage=50, seed=None):
         """
         Generate random DNA sequence
         
         Args:
             length: how many bp (base pairs)
             gc_percentage: % of G+C (rest is A+T)
+            seed: optional seed for a reproducible sequence
         
         Returns:
             str: random DNA sequence
         
         Example:
             seq = generate_random_dna(1000, gc_percentage=50)
-            # Returns 1000 random A/T/G/C with 50% G+C
+            # Returns 1000 random A/T/G/C, each base G or C with p = 0.5
+        
+        Bases are drawn as 2-bit codes in one NumPy call and mapped to
+        letters with a single gather, so no per-base Python objects are
+        created (1 Mbp takes milliseconds).
         """
-        num_gc = int(length * gc_percentage / 100)
-        num_at = length - num_gc
-        
-        chars = (
-            ['G', 'C'] * (num_gc // 2) +
-            ['A', 'T'] * (num_at // 2)
-        )
-        random.shuffle(chars)
-        return ''.join(chars[:length])
+        gc = gc_percentage / 100
+        probabilities = [(1 - gc) / 2, gc / 2, gc / 2, (1 - gc) / 2]
+        
+        rng = np.random.default_rng(seed)
+        codes = rng.choice(4, size=length, p=probabilities)
+        return _BASES[codes].tobytes().decode('ascii')
     
     @staticmethod
     def benchmark_dfa(pattern, text, iterations=3):
@@ -57,7 +68,7 @@ class BenchmarkRunner:
                 'matches': int
             }
         """
-        dfa = DFAStateMachine(pattern)
+        dfa = DFAStateMachine.get(pattern)
         times = []
         matches = 0
         
@@ -142,7 +153,10 @@ class BenchmarkRunner:
                 'matches': bench['matches'],
             })
             
-            print(f"Size: {size:>8} bp → Time: {bench['avg_ms']:.4f} ms | Matches: {bench['matches']}")
+            logger.info(
+                "Size: %8d bp → Time: %.4f ms | Matches: %d",
+                size, bench['avg_ms'], bench['matches']
+            )
         
         return results
     
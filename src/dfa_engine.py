@@ -4,6 +4,436 @@ DFA (Deterministic Finite Automaton) for DNA pattern matching
 Uses KMP-like failure function for O(n) time complexity
 """
 
+import logging
+import os
+from array import array
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+
+from .jit import njit, NUMBA_AVAILABLE
+
+logger = logging.getLogger(__name__)
+
+# Input symbols, in transition-table column order
+SYMBOLS = 'ACGTN'
+SYMBOL_CODES = {char: code for code, char in enumerate(SYMBOLS)}
+
+# Code for any byte outside SYMBOLS
+INVALID = len(SYMBOLS)
+
+# Byte -> symbol code lookup table (case-insensitive). This collapses the
+# 256 byte values into 6 equivalence classes, so transition tables need
+# one column per class instead of one per byte: a 7-state motif's DFA is
+# 7 × 5 int32 = 140 bytes
+_ENCODE_LUT = np.full(256, INVALID, dtype=np.uint8)
+for _case in (SYMBOLS, SYMBOLS.lower()):
+    _ENCODE_LUT[np.frombuffer(_case.encode('ascii'), dtype=np.uint8)] = np.arange(
+        len(SYMBOLS), dtype=np.uint8
+    )
+
+# Same table as a bytes.translate() argument
+_ENCODE_TABLE = _ENCODE_LUT.tobytes()
+
+
+def _as_uint8(buf):
+    """
+    View bytes-like data as a writable uint8 array
+    
+    The kernels are compiled eagerly for writable arrays, so read-only
+    buffers (e.g. bytes objects) are copied once.
+    """
+    arr = np.frombuffer(buf, dtype=np.uint8)
+    return arr if arr.flags.writeable else arr.copy()
+
+
+def _upper_bytes(text):
+    """
+    Text as a writable uppercase ASCII bytearray
+    
+    Sequences from load_fasta() are uppercase already; one max() over the
+    bytes (every lowercase letter is >= b'a') confirms that, so the
+    full-size upper() copy is only made for mixed-case input.
+    """
+    if isinstance(text, str):
+        buf = bytearray(text, 'ascii', 'replace')
+    else:
+        buf = bytearray(text)
+    if len(buf) and np.frombuffer(buf, dtype=np.uint8).max() >= ord('a'):
+        buf = buf.upper()
+    return buf
+
+
+def encode(text):
+    """
+    Encode DNA text as symbol codes
+    
+    Args:
+        text: DNA sequence as str, or bytes-like ASCII (bytes, bytearray,
+              memoryview, mmap)
+    
+    Returns:
+        np.ndarray[uint8]: A/C/G/T/N (either case) -> 0..4,
+                           anything else -> INVALID
+    
+    Example:
+        encode("ACGTX")  # array([0, 1, 2, 3, 5], dtype=uint8)
+    
+    bytearray.translate runs the lookup as a C loop, faster than a
+    NumPy gather over the same table, and its result is writable so the
+    compiled kernels accept it.
+    """
+    if isinstance(text, str):
+        buf = bytearray(text, 'ascii', 'replace')
+    else:
+        buf = bytearray(text)
+    return np.frombuffer(buf.translate(_ENCODE_TABLE), dtype=np.uint8)
+
+
+def _unpack_table(bits):
+    """
+    Packed byte -> its 8 // bits codes, as one 32/16-bit word per byte
+    
+    Gathering whole words and viewing them as bytes unpacks every code
+    of a byte with a single lookup.
+    """
+    shifts = np.arange(0, 8, bits)
+    codes = (np.arange(256)[:, None] >> shifts) & ((1 << bits) - 1)
+    word = np.uint32 if bits == 2 else np.uint16
+    return np.ascontiguousarray(codes, dtype=np.uint8).view(word).ravel()
+
+
+_UNPACK_TABLES = {2: _unpack_table(2), 4: _unpack_table(4)}
+
+
+def pack_codes(seq, bits=2):
+    """
+    Pack symbol codes into 2 or 4 bits each, first code in the low bits
+    
+    Args:
+        seq: np.ndarray[uint8] of codes < 2 ** bits (e.g. from encode())
+        bits: 2 (A/C/G/T, 4 bases per byte) or 4 (A/C/G/T/N, 2 per byte)
+    
+    Returns:
+        np.ndarray[uint8]: ceil(len(seq) * bits / 8) bytes; the length
+        is not stored, pass it back to unpack_codes
+    """
+    per_byte = 8 // bits
+    padded = np.zeros(-(-len(seq) // per_byte) * per_byte, dtype=np.uint8)
+    padded[:len(seq)] = seq
+    lanes = padded.reshape(-1, per_byte)
+    
+    packed = lanes[:, 0].copy()
+    for k in range(1, per_byte):
+        packed |= lanes[:, k] << np.uint8(k * bits)
+    return packed
+
+
+def unpack_codes(packed, length, bits=2):
+    """
+    Inverse of pack_codes: one symbol code per byte
+    
+    Returns:
+        np.ndarray[uint8]: the first `length` codes
+    """
+    return _UNPACK_TABLES[bits][packed].view(np.uint8)[:length]
+
+
+@njit(inline='always')
+def _walk(table, width, seq, final, capacity):
+    """
+    DFA loop shared by _scan and the _specialize_scan kernels
+    
+    Inlined into each caller at the Numba IR level, so arguments that
+    are compile-time constants there fold into the loop.
+    """
+    out = np.empty(capacity, dtype=np.int64)
+    count = 0
+    state = 0
+    
+    for i in range(len(seq)):
+        code = seq[i]
+        if code >= width:
+            # Invalid character: reset
+            state = 0
+            continue
+        
+        state = table[state * width + code]
+        
+        if state == final:
+            out[count] = i - final + 1
+            count += 1
+    
+    return out[:count]
+
+
+@njit('int64[:](int32[:], int64, uint8[:], int64, int64)', cache=True, nogil=True)
+def _scan(table, width, seq, final, capacity):
+    """
+    Run the DFA over encoded text and return match start positions
+    
+    Compiled by Numba when available; the loop is sequential (each step
+    depends on the previous state), so the gain comes from running it
+    outside the interpreter. `capacity` must bound the number of matches
+    (see DFAStateMachine.max_matches).
+    
+    There is no memchr-style skip in state 0: over four bases the lead
+    byte recurs too often for a skip to pay off.
+    """
+    return _walk(table, width, seq, final, capacity)
+
+
+def _specialize_scan(table, width, final):
+    """
+    Build a _scan kernel with one pattern's table and sizes baked in
+    
+    Numba freezes closure variables as compile-time constants, so the
+    table becomes a read-only global that LLVM knows cannot alias the
+    output, and width/final fold into the arithmetic.
+    """
+    @njit('int64[:](uint8[:], int64)', nogil=True)
+    def scan(seq, capacity):
+        return _walk(table, width, seq, final, capacity)
+    
+    return scan
+
+
+@njit('Tuple((int64[:], int64))(int32[:], int64, uint8[:], uint8[:], int64, int64)',
+      cache=True, nogil=True)
+def _scan_fused(table, width, lut, raw, final, capacity):
+    """
+    Validate, encode and run the DFA in one pass over raw ASCII bytes
+    
+    Each byte is case-folded and encoded through `lut` and fed to the
+    DFA straight away, so the text is read once instead of once per
+    validate / upper / encode step. Stops at the first byte outside
+    A/C/G/T/N.
+    
+    Returns:
+        (positions, invalid_index): invalid_index is -1 if all bytes
+        were valid, else the offset of the first invalid byte
+    """
+    out = np.empty(capacity, dtype=np.int64)
+    count = 0
+    state = 0
+    
+    for i in range(len(raw)):
+        code = lut[raw[i]]
+        if code >= width:
+            return out[:count], i
+        
+        state = table[state * width + code]
+        
+        if state == final:
+            out[count] = i - final + 1
+            count += 1
+    
+    return out[:count], -1
+
+
+@njit('int64[:](uint64[:], uint64, uint64, int64, uint8[:], int64)', cache=True, nogil=True)
+def _shift_and_scan(masks, first, accept, final, seq, capacity):
+    """
+    Shift-And scan over encoded text; returns match start positions
+    
+    Bit i of state is set while pattern[:i + 1] matches the text ending
+    at the current position. `first` is the constant 1 passed in with
+    the state's integer type so Numba keeps the arithmetic in uint64.
+    """
+    out = np.empty(capacity, dtype=np.int64)
+    count = 0
+    state = first ^ first
+    
+    for i in range(len(seq)):
+        state = ((state << 1) | first) & masks[seq[i]]
+        
+        if state & accept:
+            out[count] = i - final + 1
+            count += 1
+    
+    return out[:count]
+
+
+@njit('int64[:](uint64[:], uint64, int64, uint8[:], int64)', cache=True, nogil=True)
+def _shift_or_scan(masks, accept, final, seq, capacity):
+    """
+    Shift-Or scan: Shift-And with every bit inverted
+    
+    A clear bit i means pattern[:i + 1] matches here. Shifting in a 0
+    is free, so each character costs one shift and one OR, and bits
+    above the pattern need no masking.
+    """
+    out = np.empty(capacity, dtype=np.int64)
+    count = 0
+    state = ~(accept ^ accept)
+    
+    for i in range(len(seq)):
+        state = (state << 1) | masks[seq[i]]
+        
+        if not state & accept:
+            out[count] = i - final + 1
+            count += 1
+    
+    return out[:count]
+
+
+@njit('Tuple((int64[:], int64))(int64[:], uint8[:], uint8[:], int64, int64)',
+      cache=True, nogil=True)
+def _horspool_scan(shift, needle, raw, capacity, budget):
+    """
+    Boyer-Moore-Horspool scan over raw bytes
+    
+    The window is compared right to left and then moved by the shift of
+    its last byte, so long patterns skip most of the text unread. Bytes
+    are compared literally: no case folding and no N wildcard.
+    
+    Repetitive text (e.g. poly-A against a pattern ending in A) degrades
+    Horspool to O(n × m), so the scan gives up once `budget` byte
+    comparisons are spent.
+    
+    Returns:
+        (positions, stop): stop is -1 if the whole text was scanned, else
+        the offset from which matches have not been searched yet
+    """
+    out = np.empty(capacity, dtype=np.int64)
+    count = 0
+    m = len(needle)
+    i = m - 1
+    
+    while i < len(raw):
+        j = m - 1
+        k = i
+        while j >= 0 and raw[k] == needle[j]:
+            j -= 1
+            k -= 1
+        
+        budget -= m - j
+        if budget < 0:
+            return out[:count], i - m + 1
+        
+        if j < 0:
+            out[count] = i - m + 1
+            count += 1
+        
+        i += shift[raw[i]]
+    
+    return out[:count], -1
+
+
+@njit('Tuple((int64[:], boolean))(uint8[:], uint8, uint8, int64)', cache=True, nogil=True)
+def _pair_scan(raw, first, second, capacity):
+    """
+    Find a 2-base pattern by comparing every adjacent byte pair
+    
+    Bytes are case-folded with | 0x20, so first/second are lowercase.
+    The position is stored unconditionally and the count advances by
+    the comparison result: no data-dependent branch, so dense hits such
+    as CpG (~1 per 16 bp) cost no mispredictions.
+    
+    Returns:
+        (positions, wildcard): wildcard is True if the text has an N,
+        in which case positions must not be used (see _find_pair)
+    """
+    out = np.empty(capacity + 1, dtype=np.int64)
+    count = 0
+    wildcard = False
+    
+    for i in range(len(raw) - 1):
+        a = raw[i] | 0x20
+        out[count] = i
+        count += (a == first) & ((raw[i + 1] | 0x20) == second)
+        wildcard |= a == 110  # 'n'
+    
+    if len(raw):
+        wildcard |= (raw[len(raw) - 1] | 0x20) == 110
+    
+    return out[:count], wildcard
+
+
+def _find_all(buf, needle):
+    """
+    Find all (overlapping) occurrences of needle in buf
+    
+    bytes.find runs in C (memchr for the first byte, then a
+    fastsearch), so only candidate hits cost Python-level work.
+    
+    re.finditer is not used: it needs a lookahead for overlapping hits
+    and was not faster.
+    """
+    positions = []
+    pos = buf.find(needle)
+    
+    while pos != -1:
+        positions.append(pos)
+        pos = buf.find(needle, pos + 1)
+    
+    return np.array(positions, dtype=np.int64)
+
+
+class MatchResult(Sequence):
+    """
+    Matches of one pattern, stored as an array of start positions
+    
+    Behaves like the list of match dicts that match() used to return
+    (len, indexing, iteration, == against a list), but each dict is only
+    built when it is accessed; counting matches allocates nothing.
+    """
+    
+    def __init__(self, text, positions, length):
+        """
+        Args:
+            text: the text that was searched (str or bytes-like, any case)
+            positions: np.ndarray[int64] of match start positions
+            length: pattern length
+        """
+        self.text = text
+        self.positions = positions
+        self.length = length
+    
+    def _entry(self, pos):
+        # Only the matched slice is uppercased, not the whole text
+        matched = self.text[pos:pos + self.length]
+        if not isinstance(matched, str):
+            matched = bytes(matched).decode('ascii', 'replace')
+        return {
+            'position': pos,
+            'sequence': matched.upper(),
+            'length': self.length,
+            'score': 1.0
+        }
+    
+    def __len__(self):
+        return len(self.positions)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._entry(pos) for pos in self.positions[index].tolist()]
+        return self._entry(int(self.positions[index]))
+    
+    def __iter__(self):
+        for pos in self.positions.tolist():
+            yield self._entry(pos)
+    
+    def __eq__(self, other):
+        if isinstance(other, (MatchResult, list)):
+            return self.to_list() == list(other)
+        return NotImplemented
+    
+    def __repr__(self):
+        return f"MatchResult({len(self)} matches of length {self.length})"
+    
+    def to_list(self):
+        """Materialize every match as a dict (the old match() result)"""
+        return list(self)
+
+
+def _to_matches(text, positions, length):
+    """Wrap an array of start positions as a MatchResult"""
+    return MatchResult(text, positions, length)
+
+
 class DFAStateMachine:
     """Single-pattern DFA matching for DNA sequences"""
     
@@ -18,14 +448,49 @@ class DFAStateMachine:
             dfa = DFAStateMachine("ACG")
             matches = dfa.match("AACGTACG")
         """
+        if not pattern:
+            raise ValueError("Pattern cannot be empty")
+        
         self.pattern = pattern.upper()
-        self.alphabet = {'A', 'T', 'C', 'G', 'N'}
+        self.alphabet = set(SYMBOLS)
         self.states = len(pattern) + 1
-        self.transitions = {}
         self.failure_func = [0] * len(pattern)
         self._build_failure_function()
         self._build_transitions()
-        print(f"✓ DFA initialized for pattern: {self.pattern} ({len(pattern)} bp)")
+        # Pure ACGT patterns can be searched for as plain bytes
+        self.literal = (
+            self.pattern.encode('ascii')
+            if set(self.pattern) <= set('ACGT') else None
+        )
+        # Shift-Or: same automaton as Shift-And, one fewer op per byte
+        self.shift_or = (
+            ShiftOrMatcher(self.pattern)
+            if len(self.pattern) <= ShiftAndMatcher.MAX_LENGTH else None
+        )
+        self.horspool = (
+            HorspoolMatcher(self.pattern)
+            if self.literal is not None
+            and len(self.pattern) >= HorspoolMatcher.MIN_LENGTH else None
+        )
+        # Pattern-specific DFA kernel, see compile_specialized()
+        self.specialized = None
+        logger.debug("DFA initialized for pattern: %s (%d bp)", self.pattern, len(pattern))
+    
+    @classmethod
+    @lru_cache(maxsize=256)
+    def get(cls, pattern):
+        """
+        Shared DFA for pattern, built on first request
+        
+        Repeated searches for the same motif (benchmark loops, motif
+        pipelines) reuse the failure function, tables and matchers
+        instead of rebuilding them. The instance is shared: treat it as
+        read-only.
+        
+        Example:
+            DFAStateMachine.get("GAATTC") is DFAStateMachine.get("GAATTC")  # True
+        """
+        return cls(pattern)
     
     def _build_failure_function(self):
         """
@@ -53,69 +518,48 @@ class DFAStateMachine:
         """
         Build state transition table for DFA
         
-        For each state and character, compute next state
-        Uses failure function to handle mismatches
-        """
-        pattern = self.pattern
-        
-        # Initialize transitions
-        for state in range(self.states):
-            self.transitions[state] = {}
-            for char in self.alphabet:
-                self.transitions[state][char] = None
-        
-        # Build explicit transitions
-        for state in range(len(pattern)):
-            for char in self.alphabet:
-                if char == 'N' or char == pattern[state]:
-                    # Match: move to next state
-                    self.transitions[state][char] = state + 1
-                else:
-                    # Mismatch: use failure function to find next state
-                    self.transitions[state][char] = self._get_failure_state(state, char)
-        
-        # Final state (match found)
-        for char in self.alphabet:
-            if char == 'N' or char == pattern[-1]:
-                self.transitions[len(pattern)][char] = len(pattern)
-            else:
-                self.transitions[len(pattern)][char] = self._get_failure_state(
-                    len(pattern) - 1, char
-                )
-    
-    def _get_failure_state(self, state, char):
-        """
-        Find next state on mismatch using failure function
-        
-        When pattern[state] != char, use failure function to "slide"
-        the pattern and try again
+        Standard KMP construction: on a mismatch, state s behaves exactly
+        like its failure state, so its row is copied from the (already
+        built) row of failure_func[s - 1] before the match edge is set.
+        Each (state, char) pair is computed once: O(m × σ)
         
-        Args:
-            state: current state (0 to len(pattern)-1)
-            char: input character
+        The table is flat, row-major: table[state * len(SYMBOLS) + code]
         
-        Returns:
-            int: next state
+        Rows are indexed by symbol code, not raw byte: a 256-wide table
+        would skip encode() but is ~50x larger and no faster to scan.
         """
-        j = self.failure_func[state - 1] if state > 0 else 0
+        pattern = self.pattern
+        width = len(SYMBOLS)
+        table = array('i', [0]) * (self.states * width)
         
-        while j > 0 and self.pattern[j] != char:
-            j = self.failure_func[j - 1]
+        for state in range(self.states):
+            row = state * width
+            
+            # Mismatch: inherit transitions of the failure state
+            if state > 0:
+                fail = self.failure_func[state - 1] * width
+                table[row:row + width] = table[fail:fail + width]
+            
+            # Match: move to next state
+            if state < len(pattern):
+                for code, char in enumerate(SYMBOLS):
+                    if char == 'N' or char == pattern[state]:
+                        table[row + code] = state + 1
         
-        if self.pattern[j] == char or char == 'N':
-            return j + 1
-        else:
-            return 0
+        self.table = table
+        self.T = np.asarray(table, dtype=np.int32)
     
     def match(self, text):
         """
         Find all occurrences of pattern in text
         
         Args:
-            text: DNA sequence string
+            text: DNA sequence as str, or bytes-like ASCII (bytes, mmap,
+                  np.ndarray[uint8]); either case, no uppercase copy of
+                  the whole text is made
         
         Returns:
-            List of dicts: 
+            MatchResult: sequence of dicts, built on access
             [{
                 'position': int,
                 'sequence': str,
@@ -124,32 +568,448 @@ class DFAStateMachine:
             }, ...]
         
         Time: O(n) where n = len(text)
-        Space: O(k) where k = number of matches
-        """
-        matches = []
-        text_upper = text.upper()
-        state = 0
-        
-        for i, char in enumerate(text_upper):
-            # Get next state based on current state and character
-            if char not in self.alphabet:
-                # Invalid character: reset
-                state = 0
-                continue
-            
-            # Transition to next state
-            state = self.transitions[state].get(char, 0)
-            
-            # If we reached final state, record match
-            if state == len(self.pattern):
-                matches.append({
-                    'position': i - len(self.pattern) + 1,
-                    'sequence': text_upper[i - len(self.pattern) + 1:i + 1],
-                    'length': len(self.pattern),
-                    'score': 1.0
-                })
-                
-                # Continue searching for overlapping matches
-                state = self.failure_func[state - 1]
-        
-        return matches
+        Space: O(k) where k = number of matches (one int64 each)
+        """
+        positions = self._find(text)
+        return _to_matches(text, positions, len(self.pattern))
+    
+    def match_positions(self, text):
+        """
+        Find start positions of all occurrences of pattern in text
+        
+        Same search as match(), without building a dict per match; use
+        this (or build a DataFrame from it) for match-heavy inputs.
+        
+        Args:
+            text: DNA sequence as str or bytes-like ASCII, either case
+        
+        Returns:
+            np.ndarray[int64]: start positions, ascending
+        """
+        return self._find(text)
+    
+    def scan_fused(self, text):
+        """
+        Validate text and find match start positions in a single pass
+        
+        Replaces validate_sequence() + match_positions() for callers that
+        need both, without the uppercase copy or a separate encode pass.
+        
+        Args:
+            text: DNA sequence as str or bytes-like ASCII
+        
+        Returns:
+            (positions, invalid_index): positions is np.ndarray[int64];
+            invalid_index is the offset of the first character outside
+            ATCGN (either case), or -1 if the text is valid. Positions are
+            only those found before that character.
+        """
+        if isinstance(text, str):
+            text = bytearray(text, 'ascii', 'replace')
+        raw = _as_uint8(text)
+        final = len(self.pattern)
+        capacity = self.max_matches(len(raw))
+        
+        if NUMBA_AVAILABLE:
+            return _scan_fused(self.T, len(SYMBOLS), _ENCODE_LUT, raw, final, capacity)
+        
+        # Interpreted fallback: vectorized encode, then the usual dispatch
+        seq = _ENCODE_LUT[raw]
+        invalid = np.flatnonzero(seq == INVALID)
+        if len(invalid):
+            invalid_index = int(invalid[0])
+            positions = self._scan_codes(seq[:invalid_index])
+            return positions, invalid_index
+        return self._scan_codes(seq), -1
+    
+    def match_packed(self, packed, length, bits=2):
+        """
+        Find match start positions in a 2- or 4-bit packed sequence
+        
+        Args:
+            packed: np.ndarray[uint8] from pack_codes() or
+                    SequenceHandler.pack2bit() / pack4bit()
+            length: number of bases in the packed sequence
+            bits: 2 or 4, as packed
+        
+        Returns:
+            np.ndarray[int64]: start positions, ascending
+        
+        The bases are unpacked straight to symbol codes, so no ASCII text
+        is rebuilt.
+        """
+        return self._scan_codes(unpack_codes(packed, length, bits))
+    
+    def max_matches(self, n):
+        """
+        Upper bound on the number of matches in n characters
+        
+        Consecutive matches are at least one period apart
+        (period = m - failure_func[-1]), also for the DFA after N
+        """
+        period = len(self.pattern) - self.failure_func[-1]
+        return max(0, (n - len(self.pattern)) // period + 1)
+    
+    def _find(self, text):
+        """
+        Pick the scan for this text and return match start positions
+        
+        Without N in the text, every engine agrees with the DFA:
+        - ACGT pattern of 2 bp (CpG): adjacent-pair compare
+        - no Numba: bytes.find prescan (C-level memchr/fastsearch)
+        - ACGT pattern > 64 bp: Horspool kernel (skips most bytes)
+        - pattern <= 64 bp: Shift-Or kernel
+        Otherwise the DFA table is walked.
+        """
+        if self.literal is not None and len(self.literal) == 2:
+            positions = self._find_pair(text)
+            if positions is not None:
+                return positions
+        
+        if self.literal is not None and (self.horspool is not None or not NUMBA_AVAILABLE):
+            buf = _upper_bytes(text)
+            if b'N' not in buf:
+                if NUMBA_AVAILABLE:
+                    return self._find_horspool(buf)
+                return _find_all(buf, self.literal)
+        
+        # encode() folds case itself
+        return self._scan_codes(encode(text))
+    
+    def _find_pair(self, text):
+        """
+        Scan for a 2-base ACGT pattern such as the CpG dinucleotide
+        
+        Works on the raw bytes with no encode pass or automaton. Returns
+        None if the text contains N, where the DFA's wildcard handling
+        is not a plain window compare.
+        """
+        if isinstance(text, str):
+            text = bytearray(text, 'ascii', 'replace')
+        raw = _as_uint8(text)
+        first, second = self.literal.lower()
+        
+        if NUMBA_AVAILABLE:
+            positions, wildcard = _pair_scan(
+                raw, first, second, self.max_matches(len(raw))
+            )
+            return None if wildcard else positions
+        
+        # Interpreted fallback: the same compare, vectorized
+        folded = raw | 0x20
+        if (folded == ord('n')).any():
+            return None
+        return np.flatnonzero((folded[:-1] == first) & (folded[1:] == second))
+    
+    def _find_horspool(self, buf):
+        """
+        Horspool scan with a linear-time bound
+        
+        If the skip loop spends more than a few comparisons per byte,
+        the rest of the text is handed to the automaton scan.
+        """
+        positions, stop = self.horspool.scan_bounded(
+            buf, self.max_matches(len(buf)), 4 * len(buf)
+        )
+        if stop == -1:
+            return positions
+        
+        rest = self._scan_codes(encode(buf[stop:])) + stop
+        return np.concatenate((positions, rest))
+    
+    def compile_specialized(self):
+        """
+        Compile a DFA scan specialized to this pattern
+        
+        The transition table, width and final state become constants of
+        a dedicated kernel, which later match() calls use whenever they
+        walk the DFA (texts with N, patterns over 64 bp). Compiling
+        takes ~0.2 s, so it is opt-in: worth it for a motif that is
+        scanned over many or large sequences, e.g. together with get().
+        
+        Returns:
+            the compiled scan(seq, capacity) function, or None without
+            Numba (the generic scan is then kept)
+        """
+        if NUMBA_AVAILABLE and self.specialized is None:
+            self.specialized = _specialize_scan(self.T, len(SYMBOLS), len(self.pattern))
+        return self.specialized
+    
+    def _scan_codes(self, seq):
+        """
+        Run the compiled (or plain Python) scan over encoded text
+        
+        Composed 4-bases-per-lookup tables are not used: their gain on
+        sparse motifs is lost to the pure-ACGT check they need.
+        """
+        if self.shift_or is not None and not (seq == SYMBOL_CODES['N']).any():
+            # Without N in the text both automata agree; Shift-Or is cheaper
+            return self.shift_or.scan(seq, self.max_matches(len(seq)))
+        
+        final = len(self.pattern)
+        capacity = self.max_matches(len(seq))
+        if self.specialized is not None:
+            return self.specialized(seq, capacity)
+        if NUMBA_AVAILABLE:
+            return _scan(self.T, len(SYMBOLS), seq, final, capacity)
+        # Plain Python indexes array/bytes much faster than ndarrays
+        return _scan(self.table, len(SYMBOLS), seq.tobytes(), final, capacity)
+    
+    def match_parallel(self, text, workers=None):
+        """
+        Find all occurrences of pattern, scanning chunks of text in threads
+        
+        The text is split into `workers` chunks, each extended by
+        len(pattern) - 1 characters so matches crossing a boundary are
+        still seen. A match found in a chunk's window always starts inside
+        that chunk, so no match is reported twice.
+        
+        Args:
+            text: DNA sequence string
+            workers: number of threads (default: os.cpu_count())
+        
+        Returns:
+            MatchResult, same as match()
+        
+        The kernels release the GIL, so this only scales with Numba. Texts
+        containing N are scanned sequentially: after a wildcard the DFA
+        state depends on more than the last len(pattern) characters.
+        """
+        workers = workers or os.cpu_count() or 1
+        final = len(self.pattern)
+        seq = encode(text)
+        
+        if (not NUMBA_AVAILABLE or workers == 1 or len(seq) < 2 * workers * final
+                or (seq == SYMBOL_CODES['N']).any()):
+            return self.match(text)
+        
+        chunk = -(-len(seq) // workers)
+        starts = range(0, len(seq), chunk)
+        
+        def scan_chunk(start):
+            window = seq[start:start + chunk + final - 1]
+            return self._scan_codes(window) + start
+        
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            positions = np.concatenate(list(pool.map(scan_chunk, starts)))
+        
+        return _to_matches(text, positions, final)
+    
+    def match_many(self, sequences, workers=None):
+        """
+        Find all occurrences of pattern in each of several sequences
+        
+        Args:
+            sequences: iterable of DNA sequences (str or bytes-like), e.g.
+                       [r['sequence'] for r in load_fasta(path)]
+            workers: number of threads (default: os.cpu_count())
+        
+        Returns:
+            list of MatchResult, one per sequence, in input order
+        
+        Records are independent, so they are spread over a thread pool
+        whole; the kernels release the GIL, so this scales with Numba and
+        falls back to a plain loop without it.
+        """
+        sequences = list(sequences)
+        workers = workers or os.cpu_count() or 1
+        
+        if not NUMBA_AVAILABLE or workers == 1 or len(sequences) < 2:
+            return [self.match(seq) for seq in sequences]
+        
+        with ThreadPoolExecutor(max_workers=min(workers, len(sequences))) as pool:
+            return list(pool.map(self.match, sequences))
+
+
+class ShiftAndMatcher:
+    """Bit-parallel single-pattern matcher for patterns up to 64 bp"""
+    
+    MAX_LENGTH = 64
+    
+    def __init__(self, pattern):
+        """
+        Initialize Shift-And masks for pattern
+        
+        Args:
+            pattern: DNA pattern string, 1 to 64 characters
+        
+        Example:
+            matcher = ShiftAndMatcher("ACG")
+            matches = matcher.match("AACGTACG")
+        
+        Bit i of masks[code] is set when pattern[i] accepts that symbol.
+        N in the text matches any pattern base; N in the pattern only
+        matches N, as in DFAStateMachine.
+        """
+        self.pattern = pattern.upper()
+        length = len(self.pattern)
+        if not 0 < length <= self.MAX_LENGTH:
+            raise ValueError(
+                f"Pattern length must be 1-{self.MAX_LENGTH}, got {length}"
+            )
+        
+        # One mask per symbol code, plus INVALID (never matches)
+        masks = [0] * (len(SYMBOLS) + 1)
+        for i, char in enumerate(self.pattern):
+            code = SYMBOL_CODES.get(char)
+            if code is not None:
+                masks[code] |= 1 << i
+        masks[SYMBOL_CODES['N']] = (1 << length) - 1
+        
+        self.masks = masks
+        self.accept = 1 << (length - 1)
+        self._masks = np.array(masks, dtype=np.uint64)
+    
+    def scan(self, seq, capacity=None):
+        """
+        Find match start positions in encoded text
+        
+        Args:
+            seq: np.ndarray[uint8] from encode()
+            capacity: bound on the number of matches
+                      (default: len(seq) - len(pattern) + 1)
+        
+        Returns:
+            np.ndarray[int64]: start positions
+        """
+        final = len(self.pattern)
+        if capacity is None:
+            capacity = max(0, len(seq) - final + 1)
+        if NUMBA_AVAILABLE:
+            return _shift_and_scan(self._masks, 1, self.accept, final, seq, capacity)
+        return _shift_and_scan(
+            self.masks, 1, self.accept, final, seq.tobytes(), capacity
+        )
+    
+    def match(self, text):
+        """
+        Find all occurrences of pattern in text
+        
+        Returns:
+            MatchResult, same as DFAStateMachine.match()
+        
+        Time: O(n) where n = len(text), one shift/or/and per character
+        """
+        positions = self.scan(encode(text))
+        return _to_matches(text, positions, len(self.pattern))
+
+
+class ShiftOrMatcher(ShiftAndMatcher):
+    """Shift-And with inverted masks: one shift and one OR per character"""
+    
+    def __init__(self, pattern):
+        """
+        Initialize inverted Shift-And masks for pattern
+        
+        Args:
+            pattern: DNA pattern string, 1 to 64 characters
+        
+        Example:
+            matcher = ShiftOrMatcher("TATAAA")
+            matches = matcher.match("GCTATAAAAG")
+        
+        or_masks[code] is the 64-bit complement of masks[code], which
+        saves the OR with 1 that Shift-And needs per character.
+        """
+        super().__init__(pattern)
+        self.or_masks = [~mask & 0xFFFFFFFFFFFFFFFF for mask in self.masks]
+        self._or_masks = np.array(self.or_masks, dtype=np.uint64)
+    
+    def scan(self, seq, capacity=None):
+        """
+        Find match start positions in encoded text
+        
+        Same arguments and result as ShiftAndMatcher.scan. Without Numba
+        the Shift-And loop is used: Python ints never overflow, so the
+        inverted state would need masking on every step anyway.
+        """
+        if not NUMBA_AVAILABLE:
+            return super().scan(seq, capacity)
+        
+        final = len(self.pattern)
+        if capacity is None:
+            capacity = max(0, len(seq) - final + 1)
+        return _shift_or_scan(self._or_masks, self.accept, final, seq, capacity)
+
+
+class HorspoolMatcher:
+    """Window-skipping single-pattern matcher for longer ACGT literals"""
+    
+    # Up to 64 bp, Shift-Or (branch-free, one OR per byte) is faster on
+    # DNA: the 4-letter alphabet keeps Horspool's skips short
+    MIN_LENGTH = 65
+    
+    def __init__(self, pattern):
+        """
+        Initialize Horspool bad-character shifts for pattern
+        
+        Args:
+            pattern: DNA pattern string (no wildcards: N is compared as
+                     a literal byte)
+        
+        Example:
+            matcher = HorspoolMatcher("TATAAAAGGC")
+            matches = matcher.match("GGTATAAAAGGCT")
+        
+        shift[c] is how far the window may move when its last byte is c:
+        the distance from the last occurrence of c in pattern[:-1] to the
+        end of the pattern, or m if c does not occur there.
+        """
+        self.pattern = pattern.upper()
+        length = len(self.pattern)
+        if not length:
+            raise ValueError("Pattern cannot be empty")
+        
+        needle = self.pattern.encode('ascii')
+        shift = [length] * 256
+        for i, byte in enumerate(needle[:-1]):
+            shift[byte] = length - 1 - i
+        
+        self.needle = needle
+        self.shift = shift
+        self._needle = _as_uint8(needle)
+        self._shift = np.array(shift, dtype=np.int64)
+    
+    def scan(self, buf, capacity=None):
+        """
+        Find match start positions in uppercase ASCII bytes
+        
+        Args:
+            buf: bytes-like text, already uppercased
+            capacity: bound on the number of matches
+                      (default: len(buf) - len(pattern) + 1)
+        
+        Returns:
+            np.ndarray[int64]: start positions
+        """
+        if capacity is None:
+            capacity = max(0, len(buf) - len(self.needle) + 1)
+        # Each window costs at most m + 1 comparisons, so this never runs out
+        budget = (len(buf) + 1) * (len(self.needle) + 1)
+        positions, _ = self.scan_bounded(buf, capacity, budget)
+        return positions
+    
+    def scan_bounded(self, buf, capacity, budget):
+        """
+        Like scan(), but stop after `budget` byte comparisons
+        
+        Returns:
+            (positions, stop): stop is -1 if buf was fully scanned, else
+            the offset where the search stopped
+        """
+        if NUMBA_AVAILABLE:
+            raw = _as_uint8(buf)
+            return _horspool_scan(self._shift, self._needle, raw, capacity, budget)
+        return _horspool_scan(self.shift, self.needle, bytes(buf), capacity, budget)
+    
+    def match(self, text):
+        """
+        Find all occurrences of pattern in text
+        
+        Returns:
+            MatchResult, same as DFAStateMachine.match()
+        
+        Time: O(n / m) on random DNA for long patterns, O(n × m) worst case
+        """
+        positions = self.scan(_upper_bytes(text))
+        return _to_matches(text, positions, len(self.pattern))
@@ -0,0 +1,21 @@
+# src/jit.py
+"""
+Optional Numba support for the scanning kernels
+Falls back to plain Python when Numba is not installed
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """
+        Stand-in for numba.njit that returns the function unchanged
+        
+        Supports both @njit and @njit(signature, cache=True, ...)
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -3,11 +3,36 @@
 Database of known DNA motifs (promoters, restriction sites, etc.)
 """
 
+from types import MappingProxyType
+
+import numpy as np
+
+from .aho_corasick import AhoCorasick
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    hyperscan = None
+    HYPERSCAN_AVAILABLE = False
+
+
+def _freeze(table):
+    """Read-only view of a motif table, with read-only entries"""
+    return MappingProxyType({
+        name: MappingProxyType(entry) for name, entry in table.items()
+    })
+
 
 class MotifDatabase:
     """Store and retrieve DNA motifs"""
     
-    PROMOTER_MOTIFS = {
+    # (names, AhoCorasick) over every motif, built on first search
+    _matcher = None
+    # Hyperscan database over every motif, see compile_hyperscan()
+    _hs_database = None
+    
+    PROMOTER_MOTIFS = _freeze({
         'TATA_BOX': {
             'sequence': 'TATAAA',
             'organism': 'Eukaryotes',
@@ -32,9 +57,9 @@ class MotifDatabase:
             'gc_content': 60.00,
             'description': 'Consensus sequence around AUG start codon for translation initiation'
         },
-    }
+    })
     
-    RESTRICTION_SITES = {
+    RESTRICTION_SITES = _freeze({
         'EcoRI': {
             'sequence': 'GAATTC',
             'organism': 'E. coli',
@@ -75,9 +100,9 @@ class MotifDatabase:
             'overhang': 'blunt',
             'description': 'Produces blunt-ended cuts'
         },
-    }
+    })
     
-    CpG_SITES = {
+    CpG_SITES = _freeze({
         'CpG_DINUCLEOTIDE': {
             'sequence': 'CG',
             'organism': 'Mammals',
@@ -85,7 +110,19 @@ class MotifDatabase:
             'position': 'Gene promoters',
             'description': 'Often methylated, important for gene regulation'
         }
-    }
+    })
+    
+    # Category name -> motifs, and all categories merged once, for
+    # O(1) lookup by name. Tables and entries are read-only views, so
+    # they are handed out without copying and _SEQUENCES cannot go stale.
+    _CATEGORIES = MappingProxyType({
+        'promoters': PROMOTER_MOTIFS,
+        'restrictions': RESTRICTION_SITES,
+        'cpg_sites': CpG_SITES,
+    })
+    _INDEX = MappingProxyType({**PROMOTER_MOTIFS, **RESTRICTION_SITES, **CpG_SITES})
+    # Name -> pattern sequence, so get_motif is a single probe
+    _SEQUENCES = MappingProxyType({name: entry['sequence'] for name, entry in _INDEX.items()})
     
     @staticmethod
     def get_motif(name):
@@ -102,14 +139,7 @@ class MotifDatabase:
         Example:
             MotifDatabase.get_motif('TATA_BOX')  # 'TATAAA'
         """
-        # Check all categories
-        for category in [MotifDatabase.PROMOTER_MOTIFS, 
-                        MotifDatabase.RESTRICTION_SITES,
-                        MotifDatabase.CpG_SITES]:
-            if name in category:
-                return category[name]['sequence']
-        
-        return None
+        return MotifDatabase._SEQUENCES.get(name)
     
     @staticmethod
     def get_motif_info(name):
@@ -120,16 +150,10 @@ class MotifDatabase:
             name: motif name
         
         Returns:
-            dict: complete motif details
+            mapping: complete motif details (read-only)
             None: if not found
         """
-        for category in [MotifDatabase.PROMOTER_MOTIFS,
-                        MotifDatabase.RESTRICTION_SITES,
-                        MotifDatabase.CpG_SITES]:
-            if name in category:
-                return category[name]
-        
-        return None
+        return MotifDatabase._INDEX.get(name)
     
     @staticmethod
     def get_all_motifs():
@@ -137,13 +161,9 @@ class MotifDatabase:
         Get all available motifs
         
         Returns:
-            dict: all motifs organized by category
+            mapping: all motifs organized by category (read-only)
         """
-        return {
-            'promoters': MotifDatabase.PROMOTER_MOTIFS,
-            'restrictions': MotifDatabase.RESTRICTION_SITES,
-            'cpg_sites': MotifDatabase.CpG_SITES,
-        }
+        return MotifDatabase._CATEGORIES
     
     @staticmethod
     def list_motif_names():
@@ -153,11 +173,7 @@ class MotifDatabase:
         Returns:
             list: all names
         """
-        return (
-            list(MotifDatabase.PROMOTER_MOTIFS.keys()) +
-            list(MotifDatabase.RESTRICTION_SITES.keys()) +
-            list(MotifDatabase.CpG_SITES.keys())
-        )
+        return list(MotifDatabase._INDEX)
     
     @staticmethod
     def list_by_category(category):
@@ -168,11 +184,115 @@ class MotifDatabase:
             category: 'promoters', 'restrictions', or 'cpg_sites'
         
         Returns:
-            dict: motifs in that category
+            mapping: motifs in that category (read-only)
         """
-        categories = {
-            'promoters': MotifDatabase.PROMOTER_MOTIFS,
-            'restrictions': MotifDatabase.RESTRICTION_SITES,
-            'cpg_sites': MotifDatabase.CpG_SITES,
+        return MotifDatabase._CATEGORIES.get(category, {})
+    
+    @staticmethod
+    def find_all_motifs(text):
+        """
+        Search text for every motif in a single pass
+        
+        One Aho-Corasick automaton over all motifs replaces a DFA scan
+        per motif, so the text is read once however many motifs exist.
+        
+        Args:
+            text: DNA sequence string or ASCII bytes
+        
+        Returns:
+            dict: motif name -> np.ndarray[int64] of start positions
+        
+        Example:
+            hits = MotifDatabase.find_all_motifs("GAATTCTATAAA")
+            hits['EcoRI']  # array([0])
+        """
+        names, matcher = MotifDatabase._get_matcher()
+        positions, pattern_ids = matcher.match_arrays(text)
+        return {
+            name: positions[pattern_ids == i]
+            for i, name in enumerate(names)
         }
-        return categories.get(category, {})
+    
+    @staticmethod
+    def scan(text):
+        """
+        List every motif occurrence in text, in a single pass
+        
+        Args:
+            text: DNA sequence string or ASCII bytes
+        
+        Returns:
+            list of (motif name, start position) tuples, by position
+        
+        Example:
+            MotifDatabase.scan("GAATTCG")  # [('EcoRI', 0), ('CpG_DINUCLEOTIDE', 5)]
+        """
+        database = MotifDatabase.compile_hyperscan()
+        if database is not None:
+            return MotifDatabase._scan_hyperscan(database, text)
+        
+        names, matcher = MotifDatabase._get_matcher()
+        positions, pattern_ids = matcher.match_arrays(text)
+        order = np.argsort(positions, kind='stable')
+        return [
+            (names[pattern_id], position)
+            for position, pattern_id in zip(
+                positions[order].tolist(), pattern_ids[order].tolist()
+            )
+        ]
+    
+    @staticmethod
+    def compile_hyperscan():
+        """
+        Compile every motif into a Hyperscan block-mode database
+        
+        Returns:
+            hyperscan.Database, built once; None if the optional
+            hyperscan package is not installed (scan() then uses the
+            Aho-Corasick automaton)
+        
+        Hyperscan matches all literals at once with SIMD (Teddy/FDR)
+        instead of stepping a table per byte. Motifs are compiled
+        caseless, like the other matchers.
+        """
+        if not HYPERSCAN_AVAILABLE:
+            return None
+        
+        if MotifDatabase._hs_database is None:
+            names = MotifDatabase.list_motif_names()
+            database = hyperscan.Database()
+            database.compile(
+                expressions=[MotifDatabase.get_motif(name).encode('ascii') for name in names],
+                ids=list(range(len(names))),
+                elements=len(names),
+                flags=[hyperscan.HS_FLAG_CASELESS] * len(names),
+            )
+            MotifDatabase._hs_database = database
+        return MotifDatabase._hs_database
+    
+    @staticmethod
+    def _scan_hyperscan(database, text):
+        """scan() through Hyperscan, in the same order as the automaton"""
+        if isinstance(text, str):
+            text = text.encode('ascii', 'replace')
+        
+        names = MotifDatabase.list_motif_names()
+        lengths = [len(MotifDatabase.get_motif(name)) for name in names]
+        hits = []
+        
+        def on_match(pattern_id, start, end, flags, context):
+            # Without SOM, Hyperscan reports only the end offset
+            hits.append((end - lengths[pattern_id], lengths[pattern_id], pattern_id))
+        
+        database.scan(bytes(text), match_event_handler=on_match)
+        hits.sort()
+        return [(names[pattern_id], position) for position, _, pattern_id in hits]
+    
+    @staticmethod
+    def _get_matcher():
+        """(names, AhoCorasick) over every motif, built once"""
+        if MotifDatabase._matcher is None:
+            names = MotifDatabase.list_motif_names()
+            matcher = AhoCorasick([MotifDatabase.get_motif(name) for name in names])
+            MotifDatabase._matcher = (names, matcher)
+        return MotifDatabase._matcher
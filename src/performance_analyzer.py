@@ -3,10 +3,39 @@
 Analyze and visualize algorithm performance data
 """
 
+import numpy as np
+
 
 class PerformanceAnalyzer:
     """Analyze benchmark results and verify complexity"""
     
+    @staticmethod
+    def _extract_arrays(results):
+        """
+        Pull sizes, times and match counts out of benchmark results
+        
+        Returns:
+            (sizes, times, matches): float64, float64 and int64 arrays
+        """
+        sizes = np.array([r['text_size'] for r in results], dtype=np.float64)
+        times = np.array([r['time_ms'] for r in results], dtype=np.float64)
+        matches = np.array([r['matches'] for r in results], dtype=np.int64)
+        return sizes, times, matches
+    
+    @staticmethod
+    def _step_ratios(results):
+        """
+        Size and time ratios between consecutive results, as arrays
+        
+        Raises:
+            ValueError: if a size or time is zero or negative; the
+                        ratios would be inf or meaningless
+        """
+        sizes, times, _ = PerformanceAnalyzer._extract_arrays(results)
+        if (sizes <= 0).any() or (times <= 0).any():
+            raise ValueError("Text sizes and times must be positive")
+        return sizes[1:] / sizes[:-1], times[1:] / times[:-1]
+    
     @staticmethod
     def check_linear_time(results):
         """
@@ -43,30 +72,27 @@ class PerformanceAnalyzer:
             }
         
         tolerance = 0.2  # 20% tolerance
-        ratios = []
-        all_linear = True
         
         # Compare consecutive results
-        for i in range(len(results) - 1):
-            curr = results[i]
-            next_ = results[i + 1]
-            
-            size_ratio = next_['text_size'] / curr['text_size']
-            time_ratio = next_['time_ms'] / curr['time_ms']
-            
-            # Check if ratios match
-            ratio_diff = abs(size_ratio - time_ratio) / size_ratio
-            is_match = ratio_diff <= tolerance
-            
-            ratios.append({
+        size_ratios, time_ratios = PerformanceAnalyzer._step_ratios(results)
+        
+        # Check if ratios match
+        ratio_diffs = np.abs(size_ratios - time_ratios) / size_ratios
+        is_match = ratio_diffs <= tolerance
+        all_linear = bool(is_match.all())
+        
+        ratios = [
+            {
                 'size_ratio': size_ratio,
                 'time_ratio': time_ratio,
                 'difference': ratio_diff,
-                'is_linear': is_match,
-            })
-            
-            if not is_match:
-                all_linear = False
+                'is_linear': match,
+            }
+            for size_ratio, time_ratio, ratio_diff, match in zip(
+                size_ratios.tolist(), time_ratios.tolist(),
+                ratio_diffs.tolist(), is_match.tolist()
+            )
+        ]
         
         # Generate explanation
         if all_linear:
@@ -170,21 +196,9 @@ class PerformanceAnalyzer:
                 'evidence': 'Need at least 2 data points'
             }
         
-        # Calculate average growth rate
-        growth_rates = []
-        
-        for i in range(len(benchmark_results) - 1):
-            curr = benchmark_results[i]
-            next_ = benchmark_results[i + 1]
-            
-            size_ratio = next_['text_size'] / curr['text_size']
-            time_ratio = next_['time_ms'] / curr['time_ms']
-            
-            # Growth rate relative to linear
-            growth_rate = time_ratio / size_ratio
-            growth_rates.append(growth_rate)
-        
-        avg_growth = sum(growth_rates) / len(growth_rates)
+        # Average growth rate relative to linear
+        size_ratios, time_ratios = PerformanceAnalyzer._step_ratios(benchmark_results)
+        avg_growth = float((time_ratios / size_ratios).mean())
         
         # Classify complexity
         if avg_growth < 1.1:  # ~1x (linear)
@@ -223,15 +237,14 @@ class PerformanceAnalyzer:
         if not benchmark_results:
             return {}
         
-        times = [r['time_ms'] for r in benchmark_results]
-        sizes = [r['text_size'] for r in benchmark_results]
+        sizes, times, matches = PerformanceAnalyzer._extract_arrays(benchmark_results)
         
         return {
-            'min_time_ms': min(times),
-            'max_time_ms': max(times),
-            'avg_time_ms': sum(times) / len(times),
-            'min_size': min(sizes),
-            'max_size': max(sizes),
-            'total_matches': sum(r['matches'] for r in benchmark_results),
+            'min_time_ms': float(times.min()),
+            'max_time_ms': float(times.max()),
+            'avg_time_ms': float(times.mean()),
+            'min_size': int(sizes.min()),
+            'max_size': int(sizes.max()),
+            'total_matches': int(matches.sum()),
             'num_tests': len(benchmark_results),
         }
@@ -3,7 +3,55 @@
 DNA sequence validation, loading, and processing utilities
 """
 
-from Bio import SeqIO
+import logging
+import mmap
+import os
+
+import numpy as np
+
+from .dfa_engine import SYMBOLS, DFAStateMachine, encode, pack_codes, unpack_codes
+from .jit import njit, NUMBA_AVAILABLE
+
+logger = logging.getLogger(__name__)
+
+# Symbol code -> base letter (A=0, C=1, G=2, T=3, N=4), for bytes.translate
+_DECODE_TABLE = bytes.maketrans(bytes(range(len(SYMBOLS))), SYMBOLS.encode('ascii'))
+
+# Byte -> uppercase complement (A↔T, G↔C, N→N, other letters uppercased)
+_COMPLEMENT_MAP = str.maketrans('ATGC', 'TACG')
+_RC_TABLE = bytes(range(256)).upper().translate(
+    bytes.maketrans(b'ATGC', b'TACG')
+)
+
+# x | _GC_FOLD == _GC_FOLDED holds exactly for x in b'CGcg'
+_GC_FOLD = 0x24
+_GC_FOLDED = 0x67
+
+# Swap masks for adjacent 2-bit fields and nibbles in a 64-bit word
+_SWAP2 = np.uint64(0x3333333333333333)
+_SWAP4 = np.uint64(0x0F0F0F0F0F0F0F0F)
+
+
+@njit('float64[:](uint8[:], int64[:])', cache=True, nogil=True)
+def _gc_batch(arena, offsets):
+    """
+    GC percentage of each segment arena[offsets[k]:offsets[k + 1]]
+    
+    Same single-compare G/C test as calculate_gc_content; the count is
+    branch-free so LLVM can vectorize the inner loop.
+    """
+    out = np.zeros(len(offsets) - 1)
+    
+    for k in range(len(offsets) - 1):
+        start = offsets[k]
+        end = offsets[k + 1]
+        count = 0
+        for i in range(start, end):
+            count += (arena[i] | _GC_FOLD) == _GC_FOLDED
+        if end > start:
+            out[k] = 100.0 * count / (end - start)
+    
+    return out
 
 
 class SequenceHandler:
@@ -11,13 +59,24 @@ class SequenceHandler:
     
     VALID_CHARS = {'A', 'T', 'G', 'C', 'N'}
     
+    # Valid DNA bytes (either case) and every other byte, as
+    # bytes.translate delete sets
+    _VALID_BYTES = b'ATGCNatgcn'
+    _INVALID_BYTES = bytes(sorted(set(range(256)) - set(_VALID_BYTES)))
+    
+    # Every byte except G/C (either case), to count GC by deletion
+    _NON_GC_BYTES = bytes(sorted(set(range(256)) - set(b'GCgc')))
+    # Below this length the NumPy call overhead outweighs its speed
+    _GC_NUMPY_MIN = 2048
+    
     @staticmethod
     def validate_sequence(sequence):
         """
         Check if sequence contains only ATCG + N (wildcard)
         
         Args:
-            sequence: string
+            sequence: string, or bytes-like ASCII (bytes, bytearray,
+                      memoryview, mmap)
         
         Returns:
             bool: True if valid, False otherwise
@@ -25,12 +84,67 @@ class SequenceHandler:
         Example:
             SequenceHandler.validate_sequence("ATGC")  # True
             SequenceHandler.validate_sequence("ATGCX")  # False
+        
+        bytes.translate deletes every valid byte in one C loop; the
+        sequence is valid when nothing is left, so the output is only as
+        large as the invalid part.
         """
         if not sequence:
             return False
         
-        seq_upper = sequence.upper()
-        return all(c in SequenceHandler.VALID_CHARS for c in seq_upper)
+        if isinstance(sequence, str):
+            # Non-ASCII characters become '?', which is invalid
+            sequence = sequence.encode('ascii', 'replace')
+        elif not isinstance(sequence, (bytes, bytearray)):
+            sequence = bytes(sequence)
+        
+        return not sequence.translate(None, SequenceHandler._VALID_BYTES)
+    
+    @staticmethod
+    def iter_fasta(file_path):
+        """
+        Stream FASTA records from a memory-mapped file
+        
+        Args:
+            file_path: path to .fasta file
+        
+        Yields:
+            (header, sequence): header line without '>' (str), and the
+            sequence with line breaks and blanks removed (bytes, case kept)
+        
+        Record boundaries are found with mmap.find (memchr) and each body
+        is compacted with one bytes.translate, so a record costs one byte
+        per base and no per-line Python strings. Unlike Bio.SeqIO, text
+        before the first header is skipped rather than rejected.
+        """
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                size = len(mm)
+                # Anything before the first header is ignored
+                if mm[:1] == b'>':
+                    start = 0
+                else:
+                    start = mm.find(b'\n>') + 1
+                    if not start:
+                        return
+                
+                while True:
+                    header_end = mm.find(b'\n', start)
+                    if header_end == -1:
+                        header_end = size
+                    next_header = mm.find(b'\n>', header_end)
+                    body_end = size if next_header == -1 else next_header
+                    
+                    header = mm[start + 1:header_end].decode('ascii', 'replace').strip()
+                    sequence = mm[header_end:body_end].translate(None, b'\n\r \t')
+                    yield header, sequence
+                    
+                    if next_header == -1:
+                        break
+                    start = next_header + 1
     
     @staticmethod
     def load_fasta(file_path):
@@ -47,6 +161,8 @@ class SequenceHandler:
         
         Returns:
             List of dicts: [{'id': str, 'sequence': str, 'length': int}, ...]
+            Sequences are uppercased here, once, so the matchers find
+            nothing to case-fold.
         
         Example:
             seqs = SequenceHandler.load_fasta("genes.fasta")
@@ -55,24 +171,25 @@ class SequenceHandler:
         sequences = []
         
         try:
-            for record in SeqIO.parse(file_path, "fasta"):
-                seq_str = str(record.seq).upper()
+            for header, seq_bytes in SequenceHandler.iter_fasta(file_path):
+                record_id = header.split(maxsplit=1)[0] if header else ''
                 
-                if SequenceHandler.validate_sequence(seq_str):
+                if SequenceHandler.validate_sequence(seq_bytes):
+                    seq_str = seq_bytes.upper().decode('ascii')
                     sequences.append({
-                        'id': record.id,
-                        'description': record.description,
+                        'id': record_id,
+                        'description': header,
                         'sequence': seq_str,
                         'length': len(seq_str)
                     })
                 else:
-                    print(f"⚠️  Skipping {record.id}: contains invalid characters")
+                    logger.warning("Skipping %s: contains invalid characters", record_id)
         
         except Exception as e:
-            print(f"❌ Error loading FASTA: {str(e)}")
+            logger.error("Error loading FASTA: %s", e)
             return []
         
-        print(f"✓ Loaded {len(sequences)} sequences from {file_path}")
+        logger.debug("Loaded %d sequences from %s", len(sequences), file_path)
         return sequences
     
     @staticmethod
@@ -83,7 +200,7 @@ class SequenceHandler:
         Formula: (count_G + count_C) / total_length * 100
         
         Args:
-            sequence: DNA string
+            sequence: DNA string, or bytes-like ASCII
         
         Returns:
             float: percentage (0-100)
@@ -91,13 +208,80 @@ class SequenceHandler:
         Example:
             calculate_gc_content("ATGC")  # 50.0
             calculate_gc_content("AAAA")  # 0.0
+        
+        G/C test is (b | 0x24) == 0x67: one OR, one compare per byte.
+        
+        Short sequences (the common per-read call) skip NumPy and count
+        with bytes.translate, which has less per-call overhead.
         """
         if not sequence:
             return 0.0
         
-        seq_upper = sequence.upper()
-        gc_count = seq_upper.count('G') + seq_upper.count('C')
-        return (gc_count / len(seq_upper)) * 100
+        if isinstance(sequence, str):
+            sequence = sequence.encode('ascii', 'replace')
+        
+        if len(sequence) < SequenceHandler._GC_NUMPY_MIN:
+            kept = bytes(sequence).translate(None, SequenceHandler._NON_GC_BYTES)
+            return (len(kept) / len(sequence)) * 100
+        
+        buf = np.frombuffer(sequence, dtype=np.uint8) | _GC_FOLD
+        gc_count = np.count_nonzero(buf == _GC_FOLDED)
+        return float((gc_count / buf.size) * 100)
+    
+    @staticmethod
+    def calculate_gc_content_batch(sequences):
+        """
+        GC content of many sequences at once
+        
+        Args:
+            sequences: iterable of DNA strings or bytes-like ASCII
+        
+        Returns:
+            np.ndarray[float64]: percentage (0-100) per sequence, 0.0 for
+            empty ones; same values as calculate_gc_content
+        
+        The sequences are joined into one byte arena with offsets, and
+        one compiled pass counts every segment, so there is no per-call
+        Python overhead. Without Numba, the same count is a cumulative
+        sum over the arena.
+        """
+        parts = [
+            s.encode('ascii', 'replace') if isinstance(s, str) else bytes(s)
+            for s in sequences
+        ]
+        offsets = np.zeros(len(parts) + 1, dtype=np.int64)
+        np.cumsum([len(p) for p in parts], out=offsets[1:])
+        arena = np.frombuffer(bytearray(b''.join(parts)), dtype=np.uint8)
+        
+        if NUMBA_AVAILABLE:
+            return _gc_batch(arena, offsets)
+        
+        hits = np.concatenate(([0], np.cumsum((arena | _GC_FOLD) == _GC_FOLDED)))
+        lengths = np.diff(offsets)
+        counts = hits[offsets[1:]] - hits[offsets[:-1]]
+        return np.divide(
+            100.0 * counts, lengths,
+            out=np.zeros(len(parts)), where=lengths > 0
+        )
+    
+    @staticmethod
+    def find_cpg(sequence):
+        """
+        Find every CpG dinucleotide (C followed by G)
+        
+        Args:
+            sequence: DNA string, or bytes-like ASCII, either case
+        
+        Returns:
+            np.ndarray[int64]: start position of each "CG", ascending
+        
+        Example:
+            find_cpg("ACGTTCG")  # array([1, 5])
+        
+        Uses the shared "CG" matcher, whose 2-base path compares
+        adjacent bytes directly instead of stepping an automaton.
+        """
+        return DFAStateMachine.get("CG").match_positions(sequence)
     
     @staticmethod
     def get_reverse_complement(sequence):
@@ -120,19 +304,123 @@ class SequenceHandler:
             Step 2: TACG → reverse → GCAT
             Result: "GCAT"
         """
-        complement_map = {
-            'A': 'T', 'T': 'A',
-            'G': 'C', 'C': 'G',
-            'N': 'N'
-        }
+        if not sequence.isascii():
+            # Rare: keep non-ASCII characters as they are (uppercased)
+            return sequence.upper().translate(_COMPLEMENT_MAP)[::-1]
+        
+        return SequenceHandler.get_reverse_complement_bytes(
+            sequence.encode('ascii')
+        ).decode('ascii')
+    
+    @staticmethod
+    def get_reverse_complement_bytes(sequence):
+        """
+        Reverse complement of ASCII DNA, as bytes
+        
+        Args:
+            sequence: bytes-like ASCII DNA, either case
+        
+        Returns:
+            bytes: uppercase reverse complement; other bytes are
+                   uppercased and kept
+        
+        One bytes.translate (a C loop over a 256-byte table) and one
+        reversing slice, instead of a dict lookup per character.
+        """
+        return bytes(sequence).translate(_RC_TABLE)[::-1]
+    
+    @staticmethod
+    def get_reverse_complement_packed(packed, length):
+        """
+        Reverse complement of a pack2bit() sequence, without unpacking
+        
+        Args:
+            packed: np.ndarray[uint8] from pack2bit
+            length: number of bases
+        
+        Returns:
+            np.ndarray[uint8]: pack2bit() of the reverse complement
+        
+        With A=00 C=01 G=10 T=11 the complement is XOR 0b11, so each
+        uint64 word (32 bases) is reversed with two field swaps and a
+        byteswap, then inverted.
+        """
+        nwords = -(-len(packed) // 8)
+        words = np.zeros(nwords + 1, dtype='<u8')
+        words.view(np.uint8)[:len(packed)] = packed
+        
+        x = words[:nwords]
+        x = ((x >> np.uint64(2)) & _SWAP2) | ((x & _SWAP2) << np.uint64(2))
+        x = ((x >> np.uint64(4)) & _SWAP4) | ((x & _SWAP4) << np.uint64(4))
+        words[:nwords] = ~x[::-1].byteswap()
+        
+        # The reversed stream starts with the padding bases: shift them out
+        shift = 2 * (32 * nwords - length)
+        if shift:
+            words[:nwords] = (
+                (words[:nwords] >> np.uint64(shift))
+                | (words[1:] << np.uint64(64 - shift))
+            )
+        
+        out = words.view(np.uint8)[:len(packed)].copy()
+        if length % 4:
+            out[-1] &= (1 << 2 * (length % 4)) - 1
+        return out
+    
+    @staticmethod
+    def pack2bit(sequence):
+        """
+        Pack an A/C/G/T sequence at 2 bits per base (A=00 C=01 G=10 T=11)
+        
+        Args:
+            sequence: DNA string or bytes-like ASCII, either case
+        
+        Returns:
+            np.ndarray[uint8]: 4 bases per byte, first base in the low bits
         
-        seq_upper = sequence.upper()
+        Raises:
+            ValueError: if the sequence contains N or other characters;
+                        use pack4bit for sequences with N
         
-        # Complement
-        complement = ''.join(complement_map.get(c, c) for c in seq_upper)
+        Example:
+            packed = SequenceHandler.pack2bit("ACGTAC")  # 2 bytes
+            SequenceHandler.unpack2bit(packed, 6)  # "ACGTAC"
+        """
+        codes = encode(sequence)
+        if (codes > 3).any():
+            raise ValueError("pack2bit needs A/C/G/T only; use pack4bit for N")
+        return pack_codes(codes, 2)
+    
+    @staticmethod
+    def unpack2bit(packed, length):
+        """
+        Unpack a pack2bit() array back to an uppercase DNA string
+        
+        Args:
+            packed: np.ndarray[uint8] from pack2bit
+            length: number of bases
+        """
+        codes = unpack_codes(packed, length, 2)
+        return codes.tobytes().translate(_DECODE_TABLE).decode('ascii')
+    
+    @staticmethod
+    def pack4bit(sequence):
+        """
+        Pack an A/C/G/T/N sequence at 4 bits per base (2 bases per byte)
         
-        # Reverse
-        return complement[::-1]
+        Raises:
+            ValueError: if the sequence contains non-DNA characters
+        """
+        codes = encode(sequence)
+        if (codes > 4).any():
+            raise ValueError("Sequence contains non-DNA characters")
+        return pack_codes(codes, 4)
+    
+    @staticmethod
+    def unpack4bit(packed, length):
+        """Unpack a pack4bit() array back to an uppercase DNA string"""
+        codes = unpack_codes(packed, length, 4)
+        return codes.tobytes().translate(_DECODE_TABLE).decode('ascii')
     
     @staticmethod
     def clean_sequence(sequence):
@@ -144,21 +432,78 @@ class SequenceHandler:
         
         Returns:
             str: cleaned sequence (uppercase)
+        
+        Invalid bytes are dropped by bytes.translate in C, using the
+        complement of validate_sequence's byte set; non-ASCII characters become
+        '?' and are dropped with them.
         """
-        seq_upper = sequence.upper()
-        cleaned = ''.join(c for c in seq_upper if c in SequenceHandler.VALID_CHARS)
-        return cleaned
+        raw = sequence.encode('ascii', 'replace')
+        cleaned = raw.translate(None, SequenceHandler._INVALID_BYTES)
+        return cleaned.upper().decode('ascii')
     
     @staticmethod
-    def split_sequence(sequence, chunk_size):
+    def split_sequence(sequence, chunk_size, overlap=0):
         """
         Split sequence into chunks
         
         Args:
             sequence: DNA string
             chunk_size: size of each chunk
+            overlap: extra characters each chunk also takes from the
+                     next one; use len(motif) - 1 so that every motif
+                     occurrence lies whole in the chunk it starts in
         
         Returns:
             list: list of sequence chunks
         """
-        return [sequence[i:i+chunk_size] for i in range(0, len(sequence), chunk_size)]
+        width = chunk_size + overlap
+        return [sequence[i:i + width] for i in range(0, len(sequence), chunk_size)]
+    
+    @staticmethod
+    def isplit_sequence(sequence, chunk_size):
+        """
+        Iterate over chunks of sequence without copying them
+        
+        Args:
+            sequence: DNA string (encoded to ASCII once) or bytes-like
+            chunk_size: size of each chunk
+        
+        Yields:
+            memoryview: each chunk, a slice of one buffer; the matchers
+            accept it as is, bytes(chunk) makes a copy
+        """
+        if isinstance(sequence, str):
+            sequence = sequence.encode('ascii', 'replace')
+        
+        view = memoryview(sequence)
+        for i in range(0, len(view), chunk_size):
+            yield view[i:i + chunk_size]
+    
+    @staticmethod
+    def split_sequence_view(sequence, chunk_size):
+        """
+        Split sequence into chunks without copying it
+        
+        Args:
+            sequence: bytes-like ASCII DNA (a str is encoded once)
+            chunk_size: size of each chunk
+        
+        Returns:
+            (chunks, tail): chunks is an (n_full, chunk_size) uint8 view,
+            one row per full chunk; tail is a uint8 view of the remaining
+            len(sequence) % chunk_size bytes (possibly empty)
+        
+        Both are views into the sequence's buffer (read-only for bytes),
+        so no per-chunk string is built. The rows are contiguous and can
+        be passed to encode() or the matchers directly.
+        
+        Example:
+            chunks, tail = SequenceHandler.split_sequence_view(b"ATGCATGCA", 4)
+            chunks.shape  # (2, 4); tail.tobytes() == b"A"
+        """
+        if isinstance(sequence, str):
+            sequence = sequence.encode('ascii', 'replace')
+        
+        buf = np.frombuffer(sequence, dtype=np.uint8)
+        full = (buf.size // chunk_size) * chunk_size
+        return buf[:full].reshape(-1, chunk_size), buf[full:]
@@ -0,0 +1,90 @@
+# tests/test_aho_corasick.py
+"""Tests for multi-pattern Aho-Corasick matching"""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from src.aho_corasick import AhoCorasick
+from src.dfa_engine import encode, pack_codes
+
+
+class TestAhoCorasickMatching:
+    """Multi-pattern matching tests"""
+    
+    def test_finds_all_patterns(self):
+        """Each pattern is reported at its position"""
+        matches = AhoCorasick(['ACG', 'TGC']).match('ACGTTGC')
+        assert [(m['position'], m['pattern']) for m in matches] == [(0, 'ACG'), (4, 'TGC')]
+    
+    def test_nested_patterns(self):
+        """Patterns that are suffixes of others are reported via failure links"""
+        matches = AhoCorasick(['GAATTC', 'ATT']).match('GAATTC')
+        assert sorted((m['position'], m['pattern']) for m in matches) == [(0, 'GAATTC'), (2, 'ATT')]
+    
+    def test_overlapping_matches(self):
+        """Overlapping occurrences are all reported"""
+        matches = AhoCorasick(['AA']).match('AAAA')
+        assert [m['position'] for m in matches] == [0, 1, 2]
+    
+    def test_pattern_ids(self):
+        """pattern_id indexes the input pattern list"""
+        matches = AhoCorasick(['CCC', 'GG']).match('AGGA')
+        assert matches[0]['pattern_id'] == 1
+    
+    def test_case_insensitive(self):
+        """Lowercase text and patterns match"""
+        matches = AhoCorasick(['acg']).match('tacgt')
+        assert [m['position'] for m in matches] == [1]
+    
+    def test_bytes_input(self):
+        """Raw ASCII bytes are matched without decoding"""
+        matches = AhoCorasick(['GAATTC']).match(b'ttgaattc')
+        assert [m['position'] for m in matches] == [2]
+    
+    def test_invalid_char_resets(self):
+        """Non-DNA characters break a partial match"""
+        assert AhoCorasick(['ACG']).match('ACXG') == []
+
+
+class TestAhoCorasickTables:
+    """Packed automaton tests"""
+    
+    def test_goto_table_size(self):
+        """One row of transitions per trie state"""
+        ac = AhoCorasick(['ACG', 'ACT'])
+        # root, A, AC, ACG, ACT
+        assert ac.num_states == 5
+        assert len(ac.goto) == 5 * 6
+    
+    def test_many_matches_per_position(self):
+        """Output buffer grows when hits outnumber characters"""
+        ac = AhoCorasick(['A', 'AA', 'AAA'])
+        matches = ac.match('A' * 100)
+        assert len(matches) == 100 + 99 + 98
+    
+    def test_match_arrays(self):
+        """Parallel arrays line up with the dict output"""
+        ac = AhoCorasick(['ACG', 'CGT'])
+        positions, pattern_ids = ac.match_arrays('AACGTACG')
+        assert positions.tolist() == [1, 2, 5]
+        assert pattern_ids.tolist() == [0, 1, 0]
+    
+    def test_match_arrays_parallel(self):
+        """Chunked scan gives the same arrays, boundary hits included"""
+        ac = AhoCorasick(['ACG', 'CGTAC', 'G', 'GTN'])
+        text = 'TTACGTACGTNG' * 40
+        expected = [a.tolist() for a in ac.match_arrays(text)]
+        for workers in (2, 3, 7):
+            result = ac.match_arrays_parallel(text, workers=workers)
+            assert [a.tolist() for a in result] == expected
+    
+    def test_match_packed(self):
+        """Packed input gives the same arrays as text"""
+        ac = AhoCorasick(['ACG', 'CGT'])
+        text = 'AACGTACGNACG'
+        expected = [a.tolist() for a in ac.match_arrays(text)]
+        result = ac.match_packed(pack_codes(encode(text), 4), len(text), 4)
+        assert [a.tolist() for a in result] == expected
+        packed = pack_codes(encode('AACGTACG'), 2)
+        assert ac.match_packed(packed, 8)[0].tolist() == [1, 2, 5]
@@ -36,6 +36,18 @@ class TestDNAGeneration:
         gc_count = dna.count('G') + dna.count('C')
         gc_percent = (gc_count / 1000) * 100
         assert 70 < gc_percent < 90
+    
+    def test_generate_exact_length_odd_counts(self):
+        """Length is exact when the G+C and A+T shares are odd"""
+        for length in (1, 7, 101, 999):
+            dna = BenchmarkRunner.generate_random_dna(length, gc_percentage=33)
+            assert len(dna) == length
+    
+    def test_generate_seeded(self):
+        """Same seed gives the same sequence"""
+        first = BenchmarkRunner.generate_random_dna(500, seed=42)
+        second = BenchmarkRunner.generate_random_dna(500, seed=42)
+        assert first == second
 
 
 class TestBenchmarkDFA:
@@ -120,6 +132,26 @@ class TestLinearityCheck:
         analysis = PerformanceAnalyzer.check_linear_time(results)
         # May or may not be detected depending on tolerance
         assert 'is_linear' in analysis
+    
+    def test_zero_time_rejected(self):
+        """A zero timing raises instead of giving an infinite ratio"""
+        results = [
+            {'text_size': 1000, 'time_ms': 0.0, 'matches': 5},
+            {'text_size': 10000, 'time_ms': 10.0, 'matches': 50},
+        ]
+        with pytest.raises(ValueError):
+            PerformanceAnalyzer.check_linear_time(results)
+        with pytest.raises(ValueError):
+            PerformanceAnalyzer.calculate_complexity(results)
+    
+    def test_missing_matches_rejected(self):
+        """Results without 'matches' fail like generate_report does"""
+        results = [
+            {'text_size': 1000, 'time_ms': 1.0},
+            {'text_size': 10000, 'time_ms': 10.0},
+        ]
+        with pytest.raises(KeyError):
+            PerformanceAnalyzer.check_linear_time(results)
 
 
 class TestReportGeneration:
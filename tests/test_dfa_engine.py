@@ -8,7 +8,12 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import pytest
-from src.dfa_engine import DFAStateMachine
+import numpy as np
+from src.dfa_engine import (
+    DFAStateMachine, HorspoolMatcher, MatchResult, ShiftAndMatcher, ShiftOrMatcher,
+    encode, pack_codes, unpack_codes, SYMBOL_CODES, SYMBOLS, INVALID,
+)
+from src import dfa_engine
 
 class PerformanceAnalyzer:
     """Analyze benchmark results and verify complexity"""
@@ -241,3 +246,414 @@ class PerformanceAnalyzer:
             'total_matches': sum(r['matches'] for r in benchmark_results),
             'num_tests': len(benchmark_results),
         }
+
+
+class TestDFAMatching:
+    """DFA pattern matching tests"""
+    
+    def test_simple_match(self):
+        """Find all occurrences of a pattern"""
+        matches = DFAStateMachine("ACG").match("AACGTACG")
+        assert [m['position'] for m in matches] == [1, 5]
+    
+    def test_match_fields(self):
+        """Match dicts carry sequence, length and score"""
+        match = DFAStateMachine("ACG").match("AACGT")[0]
+        assert match['sequence'] == 'ACG'
+        assert match['length'] == 3
+        assert match['score'] == 1.0
+    
+    def test_overlapping_matches(self):
+        """Overlapping occurrences are all reported"""
+        matches = DFAStateMachine("AA").match("AAAA")
+        assert [m['position'] for m in matches] == [0, 1, 2]
+    
+    def test_no_match(self):
+        """No occurrences gives empty list"""
+        assert DFAStateMachine("GGG").match("ATATAT") == []
+    
+    def test_lowercase_text(self):
+        """Text is matched case-insensitively"""
+        matches = DFAStateMachine("acg").match("aacgt")
+        assert [m['position'] for m in matches] == [1]
+    
+    def test_invalid_char_resets(self):
+        """Non-DNA characters break a partial match"""
+        assert DFAStateMachine("ACG").match("ACXG") == []
+    
+    def test_empty_pattern_rejected(self):
+        """Empty pattern raises ValueError"""
+        with pytest.raises(ValueError):
+            DFAStateMachine("")
+
+
+class TestDFAConstruction:
+    """Failure function and transition table tests"""
+    
+    def test_failure_function(self):
+        """KMP failure function for a periodic pattern"""
+        dfa = DFAStateMachine("ACAC")
+        assert dfa.failure_func == [0, 0, 1, 2]
+    
+    def test_transition_table_size(self):
+        """One row per state, one column per symbol"""
+        dfa = DFAStateMachine("GAATTC")
+        assert len(dfa.table) == 7 * len("ACGTN")
+    
+    def test_transitions_match_naive_construction(self):
+        """Table agrees with the longest-suffix-that-is-a-prefix definition"""
+        pattern = "ACACAGT"
+        dfa = DFAStateMachine(pattern)
+        for state in range(len(pattern) + 1):
+            for code, char in enumerate("ACGT"):
+                text = pattern[:state] + char
+                expected = max(
+                    k for k in range(len(pattern) + 1)
+                    if text.endswith(pattern[:k])
+                )
+                assert dfa.table[state * 5 + code] == expected
+
+    def test_long_periodic_pattern(self):
+        """Rows copied from failure states stay correct for deep borders"""
+        pattern = "AC" * 500 + "G"
+        dfa = DFAStateMachine(pattern)
+        assert dfa.failure_func[-2] == 998
+        assert dfa.match_positions("AC" * 600 + "G").tolist() == [200]
+    
+    def test_get_reuses_instance(self):
+        """get() builds one DFA per pattern and shares it"""
+        dfa = DFAStateMachine.get("GAATTC")
+        assert DFAStateMachine.get("GAATTC") is dfa
+        assert DFAStateMachine.get("GGATCC") is not dfa
+        assert dfa.match("GAATTCGAATTC") == DFAStateMachine("GAATTC").match("GAATTCGAATTC")
+
+
+class TestEncoding:
+    """DNA symbol encoding tests"""
+    
+    def test_encode_bases(self):
+        """A/C/G/T/N map to 0..4"""
+        assert encode("ACGTN").tolist() == [0, 1, 2, 3, 4]
+    
+    def test_encode_lowercase(self):
+        """Lowercase bases share codes with uppercase"""
+        assert encode(b"acgtn").tolist() == [0, 1, 2, 3, 4]
+    
+    def test_encode_invalid(self):
+        """Non-DNA characters map to the invalid code"""
+        assert encode("AX-").tolist() == [0, 5, 5]
+    
+    def test_encode_byte_classes(self):
+        """All 256 bytes collapse to the 5 symbol classes plus INVALID"""
+        codes = encode(bytes(range(256)))
+        assert sorted(set(codes.tolist())) == [0, 1, 2, 3, 4, 5]
+        assert (codes < 5).sum() == 10
+    
+    def test_long_sequence_matches(self):
+        """Compiled scan agrees with expected positions on long input"""
+        text = "TTGAATTCTT" * 1000
+        matches = DFAStateMachine("GAATTC").match(text)
+        assert len(matches) == 1000
+        assert matches[-1]['position'] == 9992
+
+
+class TestShiftAnd:
+    """Bit-parallel matcher tests"""
+    
+    def test_agrees_with_dfa(self):
+        """Shift-And finds the same positions as the DFA"""
+        text = "GAATTCGAATTCAGAATTC"
+        expected = [m['position'] for m in DFAStateMachine("GAATTC").match(text)]
+        got = [m['position'] for m in ShiftAndMatcher("GAATTC").match(text)]
+        assert got == expected == [0, 6, 13]
+    
+    def test_text_wildcard(self):
+        """N in the text matches any pattern base"""
+        matches = ShiftAndMatcher("ACG").match("ANG")
+        assert [m['position'] for m in matches] == [0]
+    
+    def test_64bp_pattern(self):
+        """Patterns filling the whole machine word still match"""
+        pattern = "A" * 63 + "C"
+        matches = ShiftAndMatcher(pattern).match("T" + pattern + pattern)
+        assert [m['position'] for m in matches] == [1, 65]
+    
+    def test_long_pattern_rejected(self):
+        """Patterns over 64 bp raise ValueError"""
+        with pytest.raises(ValueError):
+            ShiftAndMatcher("A" * 65)
+    
+    def test_dfa_uses_shift_or_for_short_patterns(self):
+        """DFAStateMachine delegates short patterns to Shift-Or"""
+        assert DFAStateMachine("ACG").shift_or is not None
+        assert DFAStateMachine("A" * 65).shift_or is None
+
+
+class TestShiftOr:
+    """Inverted-mask Shift-And tests"""
+    
+    def test_agrees_with_shift_and(self):
+        """Shift-Or reports the same matches as Shift-And"""
+        text = "GCTATAAAAGNTATAAATATAAA" * 20
+        for pattern in ("TATAAA", "CG", "A" * 63 + "C"):
+            expected = ShiftAndMatcher(pattern).match(text)
+            assert ShiftOrMatcher(pattern).match(text) == expected
+    
+    def test_inverted_masks(self):
+        """or_masks are the 64-bit complements of the Shift-And masks"""
+        matcher = ShiftOrMatcher("ACG")
+        assert matcher.or_masks[SYMBOL_CODES['A']] == ~0b001 & (2 ** 64 - 1)
+        assert matcher.or_masks[INVALID] == 2 ** 64 - 1
+    
+    def test_invalid_char_resets(self):
+        """Non-DNA characters break a partial match"""
+        assert ShiftOrMatcher("ACG").match("ACXG") == []
+
+
+class TestLiteralPrescan:
+    """bytes.find prescan tests"""
+    
+    def test_literal_pattern(self):
+        """Pure ACGT patterns are searchable as bytes"""
+        assert DFAStateMachine("gaattc").literal == b"GAATTC"
+    
+    def test_wildcard_pattern_not_literal(self):
+        """Patterns with N go through the automaton"""
+        assert DFAStateMachine("GANTC").literal is None
+    
+    def test_text_wildcard_still_matches(self):
+        """N in the text is honoured regardless of scan choice"""
+        matches = DFAStateMachine("GAATTC").match("GANTTCGAATTC")
+        assert [m['position'] for m in matches] == [0, 6]
+
+
+class TestSpecializedScan:
+    """Pattern-specialized DFA kernel tests"""
+    
+    def test_specialized_matches_generic(self):
+        """Specialized kernel finds the same matches as the table walk"""
+        text = "GAATTCNGAATTCxgaattcGAANTTC" * 20
+        generic = DFAStateMachine("GAATTC")
+        generic.shift_or = None
+        dfa = DFAStateMachine("GAATTC")
+        dfa.shift_or = None
+        dfa.compile_specialized()
+        assert dfa.match_positions(text).tolist() == generic.match_positions(text).tolist()
+    
+    def test_specialized_matches_scan_kernel(self):
+        """Specialized kernels agree with _scan on random DNA with N"""
+        rng = np.random.default_rng(7)
+        codes = np.array([0, 1, 2, 3, SYMBOL_CODES['N'], INVALID], dtype=np.uint8)
+        seq = rng.choice(codes, 20000, p=[0.24, 0.24, 0.24, 0.24, 0.03, 0.01])
+        for pattern in ("CG", "GAATTC", "TANNNTA", "ACGT" * 20):
+            dfa = DFAStateMachine(pattern)
+            specialized = dfa.compile_specialized()
+            if specialized is None:
+                pytest.skip("Numba is not installed")
+            capacity = dfa.max_matches(len(seq))
+            expected = dfa_engine._scan(dfa.T, len(SYMBOLS), seq, len(pattern), capacity)
+            assert specialized(seq, capacity).tolist() == expected.tolist()
+    
+    def test_compile_once(self):
+        """Compiling again returns the same kernel"""
+        dfa = DFAStateMachine("ACG")
+        assert dfa.compile_specialized() is dfa.compile_specialized()
+
+
+class TestPairScan:
+    """2-base pattern fast path tests"""
+    
+    def test_pair_matches_dfa(self):
+        """Pair compare agrees with the DFA walk, N included"""
+        for text in ("ACGcgTCGXCGgc", "CNGCGnG"):
+            dfa = DFAStateMachine("CG")
+            fast = dfa.match_positions(text).tolist()
+            dfa.literal = dfa.shift_or = None
+            assert fast == dfa.match_positions(text).tolist()
+    
+    def test_pair_positions(self):
+        """Overlapping and mixed-case hits are all found"""
+        dfa = DFAStateMachine("AA")
+        assert dfa.match_positions("aAAxAA").tolist() == [0, 1, 4]
+
+
+class TestParallelMatch:
+    """Chunked multi-threaded scan tests"""
+    
+    def test_matches_sequential(self):
+        """Parallel scan finds the same matches as match()"""
+        dfa = DFAStateMachine("GAATTC")
+        text = "TTGAATTCTTGAATT" * 500
+        assert dfa.match_parallel(text, workers=4) == dfa.match(text)
+    
+    def test_match_across_chunk_boundary(self):
+        """A match spanning two chunks is reported exactly once"""
+        dfa = DFAStateMachine("ACGT")
+        text = "T" * 98 + "ACGT" + "T" * 98
+        matches = dfa.match_parallel(text, workers=2)
+        assert [m['position'] for m in matches] == [98]
+    
+    def test_match_many(self):
+        """One result per record, same as matching each on its own"""
+        dfa = DFAStateMachine("GAATTC")
+        records = ["GAATTC" * 3, "ACGT" * 10, b"ttgaattcNgaattc", ""]
+        results = dfa.match_many(records, workers=2)
+        assert len(results) == len(records)
+        for record, result in zip(records, results):
+            assert result == dfa.match(record)
+
+
+class TestMatchResult:
+    """Lazy match list tests"""
+    
+    def test_result_type(self):
+        """match() returns a MatchResult backed by a positions array"""
+        result = DFAStateMachine("ACG").match("AACGTACG")
+        assert isinstance(result, MatchResult)
+        assert result.positions.tolist() == [1, 5]
+    
+    def test_behaves_like_list(self):
+        """len, indexing, slicing and iteration give match dicts"""
+        result = DFAStateMachine("ACG").match("AACGTACG")
+        assert len(result) == 2
+        assert result[-1]['position'] == 5
+        assert result[:1] == [result[0]]
+        assert [m['sequence'] for m in result] == ['ACG', 'ACG']
+    
+    def test_to_list(self):
+        """to_list returns plain dicts equal to the result"""
+        result = DFAStateMachine("AA").match("AAAA")
+        as_list = result.to_list()
+        assert type(as_list) is list
+        assert result == as_list
+        assert as_list[2] == {'position': 2, 'sequence': 'AA', 'length': 2, 'score': 1.0}
+
+
+class TestMatchPositions:
+    """Array-valued match output tests"""
+    
+    def test_positions_array(self):
+        """match_positions agrees with match()"""
+        dfa = DFAStateMachine("ACG")
+        text = "AACGTACGNACG"
+        positions = dfa.match_positions(text)
+        assert isinstance(positions, np.ndarray)
+        assert positions.tolist() == [m['position'] for m in dfa.match(text)]
+    
+    def test_max_matches_self_overlapping(self):
+        """Period-1 pattern can match at every offset"""
+        dfa = DFAStateMachine("AA")
+        assert dfa.max_matches(10) == 9
+        assert len(dfa.match_positions("A" * 10)) == 9
+    
+    def test_max_matches_aperiodic(self):
+        """Pattern with no border matches at most every m characters"""
+        dfa = DFAStateMachine("GAATTC")
+        assert dfa.max_matches(12) == 2
+        assert dfa.max_matches(3) == 0
+    
+    def test_bytes_and_array_input(self):
+        """bytes and uint8 arrays match like str, in either case"""
+        long_pattern = "ACGT" * 17
+        for pattern in ("ACG", long_pattern):
+            dfa = DFAStateMachine(pattern)
+            text = "TT" + pattern.lower() + "GG" + pattern
+            expected = dfa.match_positions(text).tolist()
+            assert expected == [2, len(pattern) + 4]
+            raw = text.encode('ascii')
+            assert dfa.match_positions(raw).tolist() == expected
+            assert dfa.match_positions(np.frombuffer(raw, dtype=np.uint8)).tolist() == expected
+            assert dfa.match(raw)[0]['sequence'] == pattern
+
+
+class TestPackedMatch:
+    """Matching on 2-bit / 4-bit packed sequences"""
+    
+    def test_match_packed_2bit(self):
+        """Packed search agrees with match_positions"""
+        dfa = DFAStateMachine("ACG")
+        text = "AACGTACGTTACG"
+        packed = pack_codes(encode(text), 2)
+        assert dfa.match_packed(packed, len(text)).tolist() == [1, 5, 10]
+    
+    def test_match_packed_4bit_wildcard(self):
+        """N survives 4-bit packing and matches as a wildcard"""
+        dfa = DFAStateMachine("ACG")
+        text = "TANGT"
+        packed = pack_codes(encode(text), 4)
+        assert dfa.match_packed(packed, len(text), bits=4).tolist() == [1]
+    
+    def test_unpack_codes_roundtrip(self):
+        """unpack_codes inverts pack_codes"""
+        codes = encode("GATTACAN")
+        packed = pack_codes(codes, 4)
+        assert unpack_codes(packed, len(codes), 4).tolist() == codes.tolist()
+
+
+class TestFusedScan:
+    """Single-pass validate + match tests"""
+    
+    def test_valid_text(self):
+        """Valid text reports -1 and the same positions as match()"""
+        dfa = DFAStateMachine("ACG")
+        positions, invalid_index = dfa.scan_fused("aacgTACGNacg")
+        assert invalid_index == -1
+        assert positions.tolist() == [1, 5, 9]
+    
+    def test_invalid_index(self):
+        """First invalid character is reported, matches before it kept"""
+        dfa = DFAStateMachine("ACG")
+        positions, invalid_index = dfa.scan_fused("ACGTXACG")
+        assert invalid_index == 4
+        assert positions.tolist() == [0]
+    
+    def test_bytes_input(self):
+        """Bytes are scanned without decoding"""
+        positions, invalid_index = DFAStateMachine("GAATTC").scan_fused(b"ttgaattc")
+        assert invalid_index == -1
+        assert positions.tolist() == [2]
+
+
+class TestHorspool:
+    """Window-skipping literal matcher tests"""
+    
+    def test_agrees_with_dfa(self):
+        """Horspool finds the same positions as the DFA"""
+        pattern = "TATAAAAGGC"
+        text = ("GGTATAAAAGGCTATAAAAGGCA" * 50).lower()
+        matches = HorspoolMatcher(pattern).match(text)
+        dfa = DFAStateMachine(pattern)
+        dfa.horspool = None
+        assert matches == dfa.match(text)
+    
+    def test_shift_table(self):
+        """Shift is the distance from the last occurrence to the end"""
+        matcher = HorspoolMatcher("ACGTACGT")
+        assert matcher.shift[ord('G')] == 1
+        assert matcher.shift[ord('A')] == 3
+        assert matcher.shift[ord('T')] == 4
+        assert matcher.shift[ord('N')] == 8
+    
+    def test_repetitive_text_falls_back(self):
+        """Exhausting the comparison budget still finds every match"""
+        pattern = "C" + "A" * 79
+        text = "A" * 5000 + pattern + "A" * 5000
+        dfa = DFAStateMachine(pattern)
+        assert dfa.match_positions(text).tolist() == [5000]
+    
+    def test_match_on_identical_bases(self):
+        """The public matcher scans a run of one base to the end"""
+        assert len(HorspoolMatcher("A" * 65).match("A" * 5000)) == 4936
+        assert HorspoolMatcher("AA").match("A" * 10).positions.tolist() == list(range(9))
+    
+    def test_dfa_uses_horspool_for_long_literals(self):
+        """Only ACGT patterns of MIN_LENGTH or more get a Horspool matcher"""
+        assert DFAStateMachine("GATTACA" * 10).horspool is not None
+        assert DFAStateMachine("GATTACA" * 9).horspool is None
+        assert DFAStateMachine("GATTNCA" + "GATTACA" * 10).horspool is None
+    
+    def test_text_wildcard_still_matches(self):
+        """N in the text bypasses Horspool and matches as a wildcard"""
+        dfa = DFAStateMachine("GATTACA" * 10)
+        text = "CC" + "GATTNCA" + "GATTACA" * 9
+        assert dfa.match_positions(text).tolist() == [2]
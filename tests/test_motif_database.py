@@ -5,6 +5,8 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import pytest
+from src import motif_database
+from src.dfa_engine import DFAStateMachine
 from src.motif_database import MotifDatabase
 
 
@@ -39,6 +41,21 @@ class TestMotifRetrieval:
         assert 'restrictions' in all_motifs
         assert 'cpg_sites' in all_motifs
     
+    def test_category_tables_read_only(self):
+        """Category tables cannot be modified through the returned view"""
+        promoters = MotifDatabase.list_by_category('promoters')
+        with pytest.raises(TypeError):
+            promoters['NEW'] = {'sequence': 'ACGT'}
+        assert MotifDatabase.get_all_motifs()['promoters'] is promoters
+    
+    def test_motif_entries_read_only(self):
+        """Entries cannot be changed, so get_motif and get_motif_info agree"""
+        with pytest.raises(TypeError):
+            MotifDatabase.get_motif_info('TATA_BOX')['sequence'] = 'ACGT'
+        with pytest.raises(TypeError):
+            MotifDatabase.list_by_category('promoters')['TATA_BOX']['sequence'] = 'ACGT'
+        assert MotifDatabase.get_motif('TATA_BOX') == 'TATAAA'
+    
     def test_list_motif_names(self):
         """List all motif names"""
         names = MotifDatabase.list_motif_names()
@@ -89,3 +106,92 @@ class TestMotifCategories:
         """List CpG sites"""
         cpg = MotifDatabase.list_by_category('cpg_sites')
         assert 'CpG_DINUCLEOTIDE' in cpg
+
+
+class TestFindAllMotifs:
+    """Single-pass multi-motif search tests"""
+    
+    def test_every_motif_reported(self):
+        """Result has one entry per motif name"""
+        hits = MotifDatabase.find_all_motifs("ACGT")
+        assert list(hits) == MotifDatabase.list_motif_names()
+    
+    def test_positions_per_motif(self):
+        """Each motif gets its own start positions"""
+        hits = MotifDatabase.find_all_motifs("GAATTCTATAAACGGAATTC")
+        assert hits['EcoRI'].tolist() == [0, 14]
+        assert hits['TATA_BOX'].tolist() == [6]
+        assert hits['CpG_DINUCLEOTIDE'].tolist() == [12]
+        assert len(hits['BamHI']) == 0
+    
+    def test_scan_pairs(self):
+        """scan lists (name, position) pairs by start position"""
+        hits = MotifDatabase.scan("GAATTCTATAAACG")
+        assert hits == [('EcoRI', 0), ('TATA_BOX', 6), ('CpG_DINUCLEOTIDE', 12)]
+    
+    def test_hyperscan_optional(self):
+        """compile_hyperscan is None without the package"""
+        from src.motif_database import HYPERSCAN_AVAILABLE
+        database = MotifDatabase.compile_hyperscan()
+        assert (database is not None) == HYPERSCAN_AVAILABLE
+    
+    def test_real_hyperscan_matches_dfa(self, monkeypatch):
+        """The installed hyperscan package finds what per-motif DFAs find"""
+        pytest.importorskip('hyperscan')
+        text = "GAATTCTATAAACGGGATCCcgcgAAGCTTggatccTATAAAA" * 20
+        hits = MotifDatabase.scan(text)
+        assert MotifDatabase.compile_hyperscan() is not None
+        
+        expected = sorted(
+            (name, position)
+            for name in MotifDatabase.list_motif_names()
+            for position in DFAStateMachine(
+                MotifDatabase.get_motif(name)
+            ).match_positions(text).tolist()
+        )
+        assert sorted(hits) == expected
+        
+        monkeypatch.setattr(motif_database, 'HYPERSCAN_AVAILABLE', False)
+        assert MotifDatabase.scan(text) == hits
+    
+    def test_hyperscan_matches_automaton(self, monkeypatch):
+        """Hyperscan end offsets give the same pairs, in the same order"""
+        class StubDatabase:
+            """Reports every caseless literal hit by end offset only"""
+            
+            def compile(self, expressions, ids, elements, flags):
+                assert elements == len(expressions) == len(ids) == len(flags)
+                self.literals = list(zip(ids, expressions, flags))
+            
+            def scan(self, data, match_event_handler):
+                hits = []
+                for pattern_id, literal, flags in self.literals:
+                    assert flags == StubHyperscan.HS_FLAG_CASELESS
+                    text, needle = data.upper(), literal.upper()
+                    start = text.find(needle)
+                    while start != -1:
+                        hits.append((start + len(needle), pattern_id))
+                        start = text.find(needle, start + 1)
+                # By end offset; later ids first, so scan() must re-sort
+                for end, pattern_id in sorted(hits, key=lambda h: (h[0], -h[1])):
+                    match_event_handler(pattern_id, 0, end, 0, None)
+        
+        class StubHyperscan:
+            HS_FLAG_CASELESS = 1
+            Database = StubDatabase
+        
+        motifs = {'AC': 'ACG', 'ACGT': 'ACGT', 'CGT': 'CGT', 'G': 'G', 'GTA': 'GTA'}
+        monkeypatch.setattr(MotifDatabase, '_INDEX', {k: {'sequence': v} for k, v in motifs.items()})
+        monkeypatch.setattr(MotifDatabase, '_SEQUENCES', motifs)
+        monkeypatch.setattr(MotifDatabase, '_matcher', None)
+        monkeypatch.setattr(MotifDatabase, '_hs_database', None)
+        
+        text = "aACGTAcgtACGgta"
+        expected = MotifDatabase.scan(text)
+        assert expected[:4] == [('AC', 1), ('ACGT', 1), ('CGT', 2), ('G', 3)]
+        
+        monkeypatch.setattr(motif_database, 'hyperscan', StubHyperscan)
+        monkeypatch.setattr(motif_database, 'HYPERSCAN_AVAILABLE', True)
+        assert isinstance(MotifDatabase.compile_hyperscan(), StubDatabase)
+        assert MotifDatabase.scan(text) == expected
+        assert MotifDatabase.scan(text.encode('ascii')) == expected
@@ -32,6 +32,10 @@ class TestValidation:
         """Empty string is invalid"""
         assert SequenceHandler.validate_sequence("") == False
     
+    def test_none_sequence(self):
+        """None is invalid rather than an error"""
+        assert SequenceHandler.validate_sequence(None) == False
+    
     def test_lowercase_valid(self):
         """Lowercase is converted and valid"""
         assert SequenceHandler.validate_sequence("atcg") == True
@@ -39,6 +43,52 @@ class TestValidation:
     def test_mixed_case_valid(self):
         """Mixed case is valid"""
         assert SequenceHandler.validate_sequence("AtCg") == True
+    
+    def test_bytes_valid(self):
+        """Bytes and memoryviews are validated without decoding"""
+        assert SequenceHandler.validate_sequence(b"ATCGn") == True
+        assert SequenceHandler.validate_sequence(memoryview(b"ATXG")) == False
+    
+    def test_non_ascii_invalid(self):
+        """Non-ASCII characters are invalid"""
+        assert SequenceHandler.validate_sequence("ATGÇ") == False
+
+
+class TestFasta:
+    """FASTA loading tests"""
+    
+    def test_load_records(self, tmp_path):
+        """Headers, wrapped lines and case are handled"""
+        path = tmp_path / "seqs.fasta"
+        path.write_bytes(b">s1 first gene\nACGT\nacgt\n>s2\nNNAC\r\nGT\n")
+        records = SequenceHandler.load_fasta(str(path))
+        assert [r['id'] for r in records] == ['s1', 's2']
+        assert records[0]['description'] == 's1 first gene'
+        assert records[0]['sequence'] == 'ACGTACGT'
+        assert records[1]['sequence'] == 'NNACGT'
+        assert records[1]['length'] == 6
+    
+    def test_invalid_record_skipped(self, tmp_path, caplog):
+        """Records with non-DNA characters are dropped with a warning"""
+        path = tmp_path / "seqs.fasta"
+        path.write_bytes(b">bad\nACGX\n>good\nGGG\n")
+        records = SequenceHandler.load_fasta(str(path))
+        assert [r['id'] for r in records] == ['good']
+        assert "Skipping bad" in caplog.text
+    
+    def test_empty_file(self, tmp_path):
+        """An empty file has no records"""
+        path = tmp_path / "empty.fasta"
+        path.write_bytes(b"")
+        assert SequenceHandler.load_fasta(str(path)) == []
+    
+    def test_iter_fasta_bytes(self, tmp_path):
+        """iter_fasta yields headers and raw sequence bytes"""
+        path = tmp_path / "seqs.fasta"
+        path.write_bytes(b">a\nAC\nGT\n>b\ntt")
+        assert list(SequenceHandler.iter_fasta(str(path))) == [
+            ('a', b'ACGT'), ('b', b'tt')
+        ]
 
 
 class TestGCContent:
@@ -73,6 +123,47 @@ class TestGCContent:
         """Single G is 100%, single A is 0%"""
         assert SequenceHandler.calculate_gc_content("G") == 100.0
         assert SequenceHandler.calculate_gc_content("A") == 0.0
+    
+    def test_gc_mixed_case(self):
+        """Lowercase g/c count, other letters with bit 5 set do not"""
+        assert SequenceHandler.calculate_gc_content("gCaTwsgc") == 50.0
+    
+    def test_gc_bytes(self):
+        """Bytes input gives the same result as str"""
+        assert SequenceHandler.calculate_gc_content(b"ATGC") == 50.0
+    
+    def test_gc_short_and_long_agree(self):
+        """Short-input path and NumPy path give the same percentage"""
+        unit = "gCaTwsgcNA"
+        short = SequenceHandler.calculate_gc_content(unit)
+        long = SequenceHandler.calculate_gc_content(unit * 1000)
+        assert short == long == 40.0
+        assert type(short) is type(long) is float
+    
+    def test_gc_none(self):
+        """None has 0% GC rather than raising"""
+        assert SequenceHandler.calculate_gc_content(None) == 0.0
+    
+    def test_gc_batch(self):
+        """Batch results equal per-sequence results"""
+        seqs = ["ATGC", "", "gCaTwsgc", b"GGGG", "AAAA"]
+        result = SequenceHandler.calculate_gc_content_batch(seqs)
+        assert result.tolist() == [
+            SequenceHandler.calculate_gc_content(s) for s in seqs
+        ]
+
+
+class TestCpG:
+    """CpG dinucleotide search tests"""
+    
+    def test_find_cpg(self):
+        """Positions of every CG, either case"""
+        assert SequenceHandler.find_cpg("ACGTTcgCG").tolist() == [1, 5, 7]
+    
+    def test_find_cpg_bytes(self):
+        """Bytes input gives the same positions"""
+        assert SequenceHandler.find_cpg(b"CGCG").tolist() == [0, 2]
+        assert SequenceHandler.find_cpg("").tolist() == []
 
 
 class TestReverseComplement:
@@ -106,6 +197,16 @@ class TestReverseComplement:
         rc1 = SequenceHandler.get_reverse_complement(original)
         rc2 = SequenceHandler.get_reverse_complement(rc1)
         assert rc2 == original
+    
+    def test_lowercase_and_other_chars(self):
+        """Lowercase is complemented, other characters uppercased in place"""
+        result = SequenceHandler.get_reverse_complement("acgx-n")
+        assert result == "N-XCGT"
+    
+    def test_bytes_variant(self):
+        """Bytes version skips the decode"""
+        result = SequenceHandler.get_reverse_complement_bytes(b"ATGCN")
+        assert result == b"NGCAT"
 
 
 class TestCleaning:
@@ -126,6 +227,11 @@ class TestCleaning:
         """Valid sequence unchanged"""
         result = SequenceHandler.clean_sequence("ATGC")
         assert result == "ATGC"
+    
+    def test_clean_lowercase_and_non_ascii(self):
+        """Lowercase bases are kept uppercased, non-ASCII is dropped"""
+        result = SequenceHandler.clean_sequence("at gé\ncn")
+        assert result == "ATGCN"
 
 
 class TestSplitting:
@@ -145,3 +251,72 @@ class TestSplitting:
         """Chunk size larger than sequence"""
         result = SequenceHandler.split_sequence("ATG", 10)
         assert result == ["ATG"]
+    
+    def test_split_with_overlap(self):
+        """Each chunk extends into the next by overlap characters"""
+        result = SequenceHandler.split_sequence("ATGCATGCA", 4, overlap=2)
+        assert result == ["ATGCAT", "ATGCA", "A"]
+    
+    def test_isplit_memoryviews(self):
+        """isplit yields memoryview chunks equal to split_sequence's"""
+        chunks = list(SequenceHandler.isplit_sequence("ATGCATGCA", 4))
+        assert all(isinstance(c, memoryview) for c in chunks)
+        assert [bytes(c).decode() for c in chunks] == ["ATGC", "ATGC", "A"]
+    
+    def test_split_view_matches_split(self):
+        """View rows and tail equal split_sequence's chunks"""
+        raw = b"ATGCATGCA"
+        chunks, tail = SequenceHandler.split_sequence_view(raw, 2)
+        assert chunks.shape == (4, 2)
+        pieces = [row.tobytes().decode() for row in chunks] + [tail.tobytes().decode()]
+        assert pieces == SequenceHandler.split_sequence("ATGCATGCA", 2)
+    
+    def test_split_view_no_copy(self):
+        """Chunks share memory with the input buffer"""
+        raw = bytearray(b"ATGCATGC")
+        chunks, tail = SequenceHandler.split_sequence_view(raw, 4)
+        raw[0] = ord('G')
+        assert chunks[0, 0] == ord('G')
+        assert tail.size == 0
+
+
+class TestPacking:
+    """2-bit / 4-bit packing tests"""
+    
+    def test_pack2bit_layout(self):
+        """Four bases per byte, first base in the low bits"""
+        packed = SequenceHandler.pack2bit("ACGT")
+        assert packed.tolist() == [0b11100100]
+    
+    def test_pack2bit_roundtrip(self):
+        """Unpacking restores the (uppercased) sequence, odd lengths too"""
+        seq = "acgtTGCAg"
+        packed = SequenceHandler.pack2bit(seq)
+        assert len(packed) == 3
+        assert SequenceHandler.unpack2bit(packed, len(seq)) == seq.upper()
+    
+    def test_reverse_complement_packed(self):
+        """Packed RC equals packing the text RC, across word boundaries"""
+        for seq in ("ACGTTGCAG", "ATGC" * 8, "GATTACA" * 10):
+            packed = SequenceHandler.pack2bit(seq)
+            rc = SequenceHandler.get_reverse_complement_packed(packed, len(seq))
+            expected = SequenceHandler.get_reverse_complement(seq)
+            assert SequenceHandler.unpack2bit(rc, len(seq)) == expected
+            assert rc.tolist() == SequenceHandler.pack2bit(expected).tolist()
+    
+    def test_pack2bit_rejects_n(self):
+        """N does not fit in 2 bits"""
+        with pytest.raises(ValueError):
+            SequenceHandler.pack2bit("ACGN")
+    
+    def test_pack4bit_roundtrip(self):
+        """4-bit packing keeps N"""
+        seq = "ACGTNNA"
+        packed = SequenceHandler.pack4bit(seq)
+        assert len(packed) == 4
+        assert SequenceHandler.unpack4bit(packed, len(seq)) == seq
+    
+    def test_pack4bit_rejects_invalid(self):
+        """Non-DNA characters are rejected"""
+        with pytest.raises(ValueError):
+            SequenceHandler.pack4bit("ACGX")